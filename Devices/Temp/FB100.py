@@ -2,16 +2,51 @@ from Devices.Temp.TempUtility.Utils import*
 import logging
 import serial
 import minimalmodbus
+import threading
 import time
 
+class _SharedInstrument:
+    '''
+    One minimalmodbus.Instrument for a (device, channel), shared by every FB100 on it.
+    users counts the FB100 objects holding it, the entry is dropped from the pool when it reaches zero.
+    decimals caches the device's temperature decimal setting (register 84) for every FB100 on it.
+    All instruments on the same serial port use one lock, so transactions on the bus do not interleave.
+    '''
+    _portLocks = {}
+
+    def __init__(self, device, channel):
+        self.key = (device, channel)
+        self.users = 0
+        self.decimals = 0
+        self.lock = _SharedInstrument._portLocks.setdefault(device, threading.RLock())
+        self.instrument = minimalmodbus.Instrument(device, channel)
+        self.instrument.serial.baudrate = 9600 #we set baudrate as we used 9600 It might cause error you change
+        self.instrument.close_port_after_each_call = False #the port is shared, keep it open between calls
+        if not self.instrument.serial.is_open: #reused port closed by an earlier disconnect
+            self.instrument.serial.open()
+        self.serial = self.instrument.serial
+
+    def read_register(self, *args, **kwargs):
+        with self.lock:
+            return self.instrument.read_register(*args, **kwargs)
+
+    def write_register(self, *args, **kwargs):
+        with self.lock:
+            return self.instrument.write_register(*args, **kwargs)
+
 class FB100:
     __author__ = "Isaac Han"
     __email__ = "cogitoergosum01001@gmail.com"
 
+    # Instruments shared by every FB100 on the same RS485 port. Key: (device, channel), value: _SharedInstrument
+    # minimalmodbus reuses one serial.Serial per port name, so slaves on one bus do not reopen the port
+    _instruments = {}
+    _instrumentsLock = threading.Lock()
+
     def __init__(self, port = None, channel = None):
         '''
         Communication for FB100. Communicate via RKC communication protocol
-        The program assumes: RS485. To make it more versatile, simply change regex in grep funciton at Utils.py
+        The program assumes: RS485. To make it more versatile, simply change _RS485_RE at Utils.py
         It also assumes: the baudrate = 9600
                         : all PID values are integer types
 
@@ -58,8 +93,14 @@ class FB100:
         '''
         try:
             if self.port and self.channel:
-                self.instrument = minimalmodbus.Instrument(self.port["Device"], self.channel)
-                self.instrument.serial.baudrate = 9600 #we set baudrate as we used 9600 It might cause error you change
+                key = (self.port["Device"], self.channel)
+                with FB100._instrumentsLock:
+                    shared = FB100._instruments.get(key)
+                    if shared is None:
+                        shared = _SharedInstrument(self.port["Device"], self.channel)
+                        FB100._instruments[key] = shared
+                    shared.users += 1
+                    self.instrument = shared
             else:
                 print(f"Necessary args are not provided: port: {self.port} channel: {self.channel}")
         except:
@@ -69,8 +110,9 @@ class FB100:
         finally:
             if self._isFb100():
                 self.connected = True
-            else:
-                self.instrument = None
+                self.instrument.decimals = self.getTempDecimalSetting()
+            elif self.instrument:
+                self._releaseInstrument()
 
     #getting initial configuration##############################################
     def getTempDecimalSetting(self):
@@ -81,6 +123,13 @@ class FB100:
         '''
         return self.instrument.read_register(84, 0)
 
+    def _readScaled(self, registerAddress, signed=False):
+        '''
+        Reads the register with the cached decimal setting instead of asking the device for it
+        :param signed: True for temperature values, which can be negative (e.g. input scale low, register 86)
+        '''
+        return self.instrument.read_register(registerAddress, self.instrument.decimals, signed=signed)
+
     def getSettingChangeRateLimiterUnitTime(self):
         return self.instrument.read_register(214, 0)
 
@@ -93,25 +142,22 @@ class FB100:
     # setting configuration#################################################
 
     def setTempUnit(self, aInt):
-        assert isinstance(aInt, int), "Invalid data type for setTempUnit. It expects an integer"
-        if 0 <= aInt <= 2:
-            self.instrument.write_register(83, aInt) # for degree C
-        else:
-            raise Exception(f"Error with setting TempUnit Unknown command {aInt}")
+        if type(aInt) is not int or not 0 <= aInt <= 2:
+            raise ValueError(f"Error with setting TempUnit Unknown command {aInt!r}")
+        self.instrument.write_register(83, aInt) # for degree C
 
     def setTemperatureDecimal(self, aInt):
-        assert isinstance(aInt, int), "Invalid data type for setTemperatureUnit. It expects an integer"
-        if 0 <= aInt <= 2:
-            self.instrument.write_register(84, aInt)
-        else:
-            raise Exception(f"setTemperatureUnit Expects 0 or 1, not {aInt}")
+        if type(aInt) is not int or aInt not in (0, 1, 2):
+            raise ValueError(f"setTemperatureDecimal Expects 0, 1 or 2, not {aInt!r}")
+        self.instrument.write_register(84, aInt)
+        self.instrument.decimals = aInt
 
     # get Process values ##################################
     def getTemperature(self):
-        return self.instrument.read_register(0, self.getTempDecimalSetting())
+        return self._readScaled(0, signed=True)
 
     def getSetValueMonitor(self):
-        return self.instrument.read_register(3, self.getTempDecimalSetting())
+        return self._readScaled(3, signed=True)
 
     def getHeatSideMVI(self):
         return self.instrument.read_register(13, 1)
@@ -124,9 +170,9 @@ class FB100:
         Unit is important: Call self.getTempUnit
         There is also 1/10th setting in derivative time unit
         '''
-        P_heat = self.instrument.read_register(45, self.getTempDecimalSetting())
-        I_heat = self.instrument.read_register(46, self.getTempDecimalSetting())
-        D_heat = self.instrument.read_register(47, self.getTempDecimalSetting())
+        P_heat = self._readScaled(45)
+        I_heat = self._readScaled(46)
+        D_heat = self._readScaled(47)
         return (P_heat, I_heat, D_heat)
 
     def getCoolingPID(self):
@@ -134,9 +180,9 @@ class FB100:
         Unit is important:
         :return:
         '''
-        P_cool = self.instrument.read_register(49, self.getTempDecimalSetting())
-        I_cool = self.instrument.read_register(50, self.getTempDecimalSetting())
-        D_cool = self.instrument.read_register(51, self.getTempDecimalSetting())
+        P_cool = self._readScaled(49)
+        I_cool = self._readScaled(50)
+        D_cool = self._readScaled(51)
         return (P_cool, I_cool, D_cool)
 
     def getRampingRateLower(self):
@@ -144,21 +190,21 @@ class FB100:
         There are two ramping rate limiter one is down and the other is up
         :return: (lower limit, upper limit)
         '''
-        return self.instrument.read_register(55, self.getTempDecimalSetting())
+        return self._readScaled(55)
 
     def getRampingRateUpper(self):
         '''
         There are two ramping rate limiter one is down and the other is up
         :return: (lower limit, upper limit)
         '''
-        return self.instrument.read_register(54, self.getTempDecimalSetting())
+        return self._readScaled(54)
 
     def getSetValue(self):
         '''
         This gets the set temperature value
         :return:
         '''
-        return self.instrument.read_register(44, self.getTempDecimalSetting())
+        return self._readScaled(44, signed=True)
 
     def getHeatingManipulatedOutputValue(self):
         '''
@@ -211,7 +257,7 @@ class FB100:
         There are two ramping rate limiter one is down and the other is up
         :return: (lower limit, upper limit)
         '''
-        return self.instrument.write_register(55, aFloat, self.getTempDecimalSetting())
+        return self.instrument.write_register(55, aFloat, self.instrument.decimals)
 
     def setRampingRateUpper(self, aFloat):
         assert isinstance(aFloat, float) or isinstance(aFloat, int), f"Problem with float: {aFloat} in setRampingRateHigher"
@@ -219,7 +265,7 @@ class FB100:
         There are two ramping rate limiter one is down and the other is up
         :return: (lower limit, upper limit)
         '''
-        return self.instrument.write_register(54, aFloat, self.getTempDecimalSetting())
+        return self.instrument.write_register(54, aFloat, self.instrument.decimals)
 
     def setSetValue(self, aFloat):
         '''
@@ -232,27 +278,28 @@ class FB100:
         Named as set temp. What is it????
         :return: 
         '''
-        self.instrument.write_register(44, aFloat, self.getTempDecimalSetting())
+        self.instrument.write_register(44, aFloat, self.instrument.decimals)
 
     # get operations#######################################################
     def getRunOrStop(self):
         return self.instrument.read_register(35, 0)
 
     def getInputScaleLow(self):
-        return self.instrument.read_register(86, self.getTempDecimalSetting())
+        return self._readScaled(86, signed=True)
 
     def getInputErrorDetermination(self):
-        return self.instrument.read_register(88, self.getTempDecimalSetting())
+        return self._readScaled(88, signed=True)
 
     def getSettingLimiterLow(self):
-        return self.instrument.read_register(216, self.getTempDecimalSetting())
+        return self._readScaled(216, signed=True)
 
     # set operations ######################################################
     def getInputScaleHigh(self):
-        return self.instrument.read_register(86, self.getTempDecimalSetting())
+        return self._readScaled(86, signed=True)
 
     def  setRunOrStop(self, aInt):
-        assert isinstance(aInt, int) and 0<=aInt<=1, f"{aInt} is not a valid integer"
+        if type(aInt) is not int or not 0 <= aInt <= 1:
+            raise ValueError(f"{aInt!r} is not a valid integer")
         self.instrument.write_register(35, aInt)
 
     def setInputScaleLow(self, aFloat):
@@ -267,10 +314,28 @@ class FB100:
         assert isinstance(aFloat, float), f"Invalid float with {aFloat} in setSettingLimiterLow"
         self.instrument.write_register(216, aFloat)
 
+    def _releaseInstrument(self):
+        '''
+        Gives the shared instrument back to the pool.
+        :return: True when this was the last user of the serial port, so the port may be closed
+        '''
+        shared, self.instrument = self.instrument, None
+        self.connected = False
+        with FB100._instrumentsLock:
+            shared.users -= 1
+            if shared.users > 0:
+                return False
+            FB100._instruments.pop(shared.key, None)
+            return not any(device == shared.key[0] for device, _ in FB100._instruments)
+
     def disconnect(self):
         if self.instrument:
+            serialPort = self.instrument.serial
+            if not self._releaseInstrument():
+                print("Serial port is still used by another FB100. It is left open.")
+                return
             try:
-                self.instrument.serial.close()
+                serialPort.close()
                 print("Serial port closed successfully.")
             except Exception as e:
                 print(f"Error closing serial port: {e}")
@@ -290,18 +355,21 @@ class FB100:
         Using
         '''
 
-        counter = 0
-        while counter < 10:
-            counter += 1
-            time.sleep(0.5)
+        if self.getTemperature() < 100: #already cool, no need to wait
+            self.setRunOrStop(1)
+            return
+
+        #cool down towards 90 once, then only poll the temperature
+        self.setSingleRampingRate(50.0)
+        self.setSetValue(90)
+        self.setRunOrStop(0) #keep running until cooled off
+
+        deadline = time.monotonic() + 10.0
+        while time.monotonic() < deadline:
+            time.sleep(0.2)
             if self.getTemperature() < 100:
                 self.setRunOrStop(1)
                 return
-            else:
-                self.setSingleRampingRate(50)
-                self.setSetValue(90)
-                self.setRunOrStop(0) #keep running until cooled off
-                time.sleep(0.5)
         self.setRunOrStop(1) #turned off after about 10 seconds no matter what
 
         #looping over 5 times to ensure the device is stopped. If the device is not stopped,
@@ -317,21 +385,20 @@ class FB100:
         return
 
     def updateFieldsInfo(self):
-        self.temperature["Temperature"]["CurrentTemp"] = self.getTemperature()
-        self.temperature["Temperature"]["SetTemp"] = self.getSetValue()
-        self.temperature["Temperature"]["RampingTemp"] = self.getRampingRateLower() # assumes lower ramping == upper
-        # self.temperature["Temperature"]["HotPower"] = self.getHeatingManipulatedOutputValue()
-        # self.temperature["Temperature"]["HotPower"] = self.getCoolingManipulatedOutputValue()
-
-        PID_hot = self.getHeatingPID()
-        self.temperature["PID"]["P_hot"] = PID_hot[0]
-        self.temperature["PID"]["I_hot"] = PID_hot[1]
-        self.temperature["PID"]["D_hot"] = PID_hot[2]
-
-        PID_cool = self.getCoolingPID()
-        self.temperature["PID"]["P_cool"] = PID_cool[0]
-        self.temperature["PID"]["I_cool"] = PID_cool[1]
-        self.temperature["PID"]["D_cool"] = PID_cool[2]
+        self.temperature["Temperature"].update({
+            "CurrentTemp": self.getTemperature(),
+            "SetTemp": self.getSetValue(),
+            "RampingTemp": self.getRampingRateLower(), # assumes lower ramping == upper
+            # "HotPower": self.getHeatingManipulatedOutputValue(),
+            # "CoolPower": self.getCoolingManipulatedOutputValue(),
+        })
+
+        P_hot, I_hot, D_hot = self.getHeatingPID()
+        P_cool, I_cool, D_cool = self.getCoolingPID()
+        self.temperature["PID"].update({
+            "P_hot": P_hot, "I_hot": I_hot, "D_hot": D_hot,
+            "P_cool": P_cool, "I_cool": I_cool, "D_cool": D_cool,
+        })
 
 if __name__ == "__main__":
     ports, deviceInfo = all_ports()
@@ -8,6 +8,7 @@ class FB100_LN(FB100):
     def __init__(self, port=None, channel=None):
         super().__init__(port, channel)
 
-        lower = -200
-        decimal = self.getTempDecimalSetting()
-        self.instrument.set(float(f"{lower:.}"))
\ No newline at end of file
+        if self.instrument:
+            lower = -200
+            # input scale low (register 86) is stored as a signed integer scaled by the decimal setting
+            self.instrument.write_register(86, int(lower * 10 ** self.instrument.decimals), 0, signed=True)
\ No newline at end of file
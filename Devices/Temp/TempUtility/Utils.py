@@ -1,12 +1,19 @@
-from serial.tools.list_ports import grep
+from serial.tools.list_ports import comports
+from functools import reduce
+from operator import xor
+import re
 import serial
 
+_RS485_RE = re.compile("RS485", re.IGNORECASE) # change the pattern to match other adapters
+
 def all_ports():
-    # Get a list of available serial ports
-    ports = grep("RS485")  # Empty string to match all ports
+    # Get a list of available serial ports whose description or hardware id mentions RS485
+    ports = [port for port in comports()
+             if _RS485_RE.search(port.description or "") or _RS485_RE.search(port.hwid or "")]
 
     # List to hold dictionaries of port details
     port_list = []
+    DeviceInfo = ""
 
     for port in ports:
         # Create a dictionary for each port's details
@@ -75,10 +82,9 @@ def bcc_check(data):
     :return: bcc_result
     tested using bcc("M100100.0\03") == 80
     '''
-    bcc = 0x00
-    for byte in data:
-        bcc ^= byte
-    return chr(byte)
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    return reduce(xor, data, 0x00) # the xor fold runs in C instead of a Python loop
 
 def crc16_ccitt_false(data: bytes, poly=0xA001, init_crc=0xFFFF):
     """
@@ -18,7 +18,6 @@ class Display(Toplevel):
 
         super().__init__(parent)
         self.geometry("800x700")
-        self.iconphoto(False, makeIconPhoto())
         self.option_add("*tearOff", FALSE)
         self.resizable(False, False) #if I fail managing geometry, I will block resizing
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -1,18 +1,54 @@
 from tkinter import *
 import tkinter.ttk as ttk
 import os
+import weakref
 from PIL import Image, ImageTk
 
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) #GUI folder, with Images_logo and Images_svg
+
 def print_hierarchy(w, depth=0):
     print('  '*depth + w.winfo_class() + ' w=' + str(w.winfo_width()) + ' h=' + str(w.winfo_height()) +
           ' x=' + str(w.winfo_x()) + ' y=' + str(w.winfo_y()))
     for i in w.winfor_children():
         print_hierarchy(i, depth+1)
 
+# Image loader: decodes each path only once, later calls get the same PhotoImage back,
+# i.e. when a window is opened again. Images are shown at their native size, resized copies
+# are baked ahead of time by scripts/bake_icons.py.
+# The cache holds the images weakly, an entry goes away with the last widget that shows it
+_photoCache = weakref.WeakValueDictionary()
+
+def loadPhoto(path):
+    photo = _photoCache.get(path)
+    if photo is None:
+        photo = _photoCache[path] = _decodePhoto(path)
+    return photo
+
+def _decodePhoto(path):
+    with Image.open(path) as image:
+        #an alpha channel that is opaque everywhere only costs memory and conversion work in Tk
+        if image.mode == "RGBA" and image.getextrema()[3] == (255, 255):
+            image = image.convert("RGB")
+        return ImageTk.PhotoImage(image)
+
+def imageSize(path):
+    #Image.open only reads the file header, the pixel data is not decoded here
+    with Image.open(path) as image:
+        return image.size
+
 def makeIconPhoto():
-    path = os.path.join(os.path.dirname(__file__), "../Images_logo/RootLogo.png")
-    image = ImageTk.PhotoImage(Image.open(path).resize((180, 50), Image.Resampling.LANCZOS))
-    return image
+    #native size: the window manager scales the icon down to its own title bar and taskbar sizes anyway
+    path = os.path.join(ASSET_DIR, "Images_logo", "RootLogo.png")
+    return loadPhoto(path)
+# Grids widgets into one row, column 0, 1, 2, ... with a single "grid configure" Tcl call per widget,
+# the options are converted once instead of going through the keyword parsing of .grid() for every widget
+def gridRow(widgets, row, **options):
+    args = ["-row", row]
+    for key, value in options.items():
+        args += ["-" + key, value]
+    for column, widget in enumerate(widgets):
+        widget.tk.call("grid", "configure", widget._w, "-column", column, *args)
+
 # Window Depth
 def printWindowDepth(root, window):
     print(root.tk.eval("WM_stackorder " + str(window)))
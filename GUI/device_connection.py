@@ -25,7 +25,6 @@ class TempConnection(Toplevel):
         super().__init__(parent)
         self.root = getRoot(self)
         self.geometry("800x600")
-        self.iconphoto(False, makeIconPhoto())
         self.option_add("*tearOff", FALSE)
         self.resizable(False, False) #if I fail managing geometry, I will block resizing
         self.rowconfigure((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12), weight=1, uniform='a')
@@ -36,8 +35,6 @@ class TempConnection(Toplevel):
         ttk.Button(self, text="Connect", command= self.connect_temp).grid(row=0, column=5, sticky="we")
         ttk.Button(self, text="DisConnect", command= self.disconnect_temp).grid(row=0, column=6, sticky="we")
 
-        s = ttk.Style()
-        s.configure("Device.TLabel", font=("Helvetica", 12), foreground=Color["Black"])
         ttk.Label(self, text="Connection", anchor="w", style="Device.TLabel").grid(row=0, column=0, sticky="nw")
         ttk.Label(self, text="Model", anchor="w", style="Device.TLabel").grid(row=1, column=0, sticky="nw")
         ttk.Label(self, text="Unit", anchor="w", style="Device.TLabel").grid(row=2, column=0, sticky="nw")
@@ -95,12 +92,7 @@ class TempConnection(Toplevel):
         self.disconnect_temp()
 
     def connect_temp(self):
-        s = ttk.Style()
-        s.configure("on.TLabel", font=("Helvetica", 18), foreground=Color["White"],
-                    background="blue")
-        s.configure("off.TLabel", font=("Helvetica", 18), foreground=Color["White"],
-                    background=Color["Black"])
-
+        #the on.TLabel and off.TLabel styles are installed once by APP.installStyles
         allPorts, _ = all_ports()
         if len(self.root.devices["Temp"]) > 0:
             print("a device is already connected")
@@ -110,8 +102,7 @@ class TempConnection(Toplevel):
             device = FB100(port, 1) #channel is assumed to be 1
             if device.connected:
                 self.root.devices["Temp"].append(device)
-                self.parent.DeviceFrame[3][0].set("On")
-                self.parent.DeviceFrame[2][0].config(style="on.TLabel")
+                self.parent.setDeviceStatus(0, True)
 
                 self.root.lift()
                 self.root.focus()
@@ -121,8 +112,7 @@ class TempConnection(Toplevel):
         if self.root.devices["Temp"]:
             self.root.devices["Temp"][0].disconnect()
         self.root.devices["Temp"] = []
-        self.parent.DeviceFrame[3][0].set("Off")
-        self.parent.DeviceFrame[2][0].config(style="off.TLabel")
+        self.parent.setDeviceStatus(0, False)
 
 
 
@@ -4,8 +4,8 @@ from tkinter import *
 from tkinter import messagebox
 
 import tkinter.ttk as ttk
-from PIL import Image, ImageTk
 import os
+from collections import namedtuple
 from GUI_Utility.Utilities import*
 
 # from Temp.FB100 import FB100
@@ -13,6 +13,17 @@ from GUI_Utility.Utilities import*
 from device_connection import *
 from Display import *
 
+#Label Name, Image (relative to ASSET_DIR), name of the Main method called on click (None: prints the label)
+Device = namedtuple("Device", "label imagePath command")
+DEVICES = (
+    Device("Temperature", "Images_svg/Temperature.webp", "create_temp"),
+    Device("Mass Flow", "Images_svg/Mass Flow.webp", None),
+    Device("Humidity", "Images_svg/Humidity.webp", None),
+    Device("Pressure", "Images_svg/Pressure.webp", None),
+    Device("Measure", "Images_svg/Measure.webp", None),
+    Device("Sample Feeder", "Images_svg/SampleFeeder.webp", None),
+)
+
 class APP(Tk):
     def __init__(self, title, size):
         #Color and Size constant that we use for main widget
@@ -24,9 +35,10 @@ class APP(Tk):
         #main setup
         super().__init__()
         self.checkWindow()
+        self.installStyles()
         self.title(title)
         self.geometry(f"{size[0]}x{size[1]}")
-        self.iconphoto(False, makeIconPhoto())
+        self.iconphoto(True, makeIconPhoto()) #True: also the default icon of every Toplevel opened later
         self.option_add("*tearOff", FALSE)
         # self.protocol("WM_DELETE_WINDOW", self.quit) # turned off during development
         self.resizable(False, False) #if I fail managing geometry, I will block resizing
@@ -40,9 +52,20 @@ class APP(Tk):
         #Devices
         self.devices = {"Temp": [], "MFC": [], "Humidity": [], "Pressure": [], "Measurement": []}
 
-
-        #run
-        self.mainloop()
+    def installStyles(self):
+        #every ttk style of the program is configured here once, instead of in each widget's constructor
+        s = ttk.Style()
+        s.configure("TFrame", background= Color["Black"], width=SIZE[0] , height=300)
+        s.configure("Menu.TButton", font=("Helvetica", 12), foreground=Color["Black"])
+        s.configure("Main.TFrame", background= Color["White"], width=SIZE[0])
+        s.configure("Menu.TLabel", font=("Helvetica", 12, "bold"), foreground=Color["Black"])
+        s.configure("Main.TButton", font=("TimesNewRoman", 12), foreground=Color["Black"])
+        s.configure("MainDeviceTitle.TLabel", font=("TimesNewRoman", 14, "bold"), foreground=Color["Black"])
+        s.configure("MainDeviceImage.TLabel", font=("Helvetica", 18), foreground=Color["White"], background=Color["Black"])
+        #device windows
+        s.configure("Device.TLabel", font=("Helvetica", 12), foreground=Color["Black"])
+        s.configure("on.TLabel", font=("Helvetica", 18), foreground=Color["White"], background="blue")
+        s.configure("off.TLabel", font=("Helvetica", 18), foreground=Color["White"], background=Color["Black"])
 
     def checkWindow(self):
         if sys.platform.startswith("win"):
@@ -56,8 +79,6 @@ class APP(Tk):
 
 class Menu(ttk.Frame):
     def __init__(self, parent):
-        s = ttk.Style()
-        s.configure("TFrame", background= Color["Black"], width=SIZE[0] , height=300)
         super().__init__(parent, style="TFrame")
         self.parent = parent
         self.grid(row=0, column=0, sticky="nsew")
@@ -67,7 +88,7 @@ class Menu(ttk.Frame):
         self.label['image'] = self.image
         self.label.grid(row=0, column=0, rowspan=3, columnspan=2, pady=(10, 20))
         self.buttons = self.makeButtons()
-        self.columnconfigure((0, 1, 2, 3, 4, 5), uniform="b")
+        self.columnconfigure(tuple(range(len(self.buttons))), uniform="b")
         self.rowconfigure(1, uniform="b")
         #button topLevels
         self.displayWindow = None
@@ -77,9 +98,9 @@ class Menu(ttk.Frame):
 
 
     def makeImage(self):
-        logo_path = os.path.join(os.path.dirname(__file__), "Images_logo/logo.png")
-        image = ImageTk.PhotoImage(Image.open(logo_path).resize((180, 50), Image.Resampling.LANCZOS))
-        return image
+        #pre-resized by scripts/bake_icons.py, so no resampling is done at start-up
+        logo_path = os.path.join(ASSET_DIR, "Images_logo", "logo.180x50.png")
+        return loadPhoto(logo_path)
 
     #Button Widget functioons
     def homeCliked(self):
@@ -93,8 +114,6 @@ class Menu(ttk.Frame):
             self.displayWindow.lift()
             self.displayWindow.focus()
     def makeButtons(self):
-        s = ttk.Style()
-        s.configure("Menu.TButton", font=("Helvetica", 12), foreground=Color["Black"])
         ans = []
         buttons = [
             ("Home", self.homeCliked),
@@ -107,19 +126,19 @@ class Menu(ttk.Frame):
 
         for i, (text, command) in enumerate(buttons):
             ans.append(ttk.Button(self, text=text, command=command, style="Menu.TButton"))
-        for i in range(len(ans)):
-            ans[i].grid(row=3, column=i, sticky="sew", padx=0, pady=(0, 2))
+        gridRow(ans, 3, sticky="sew", padx=0, pady=(0, 2))
         return ans
 
 class Main(ttk.Frame):
+    #shared looks of a device status label (text, style), swapped in by setDeviceStatus
+    STATUS_ON = ("On", "on.TLabel")
+    STATUS_OFF = ("Off", "off.TLabel")
+
     def __init__(self, parent):
-        s = ttk.Style()
-        s.configure("Main.TFrame", background= Color["White"], width=SIZE[0])
         super().__init__(parent, style="Main.TFrame")
         self.parent = parent
         self.grid(row=1, column=0, sticky="nsew")
 
-        s.configure("Menu.TLabel", font=("Helvetica", 12, "bold"), foreground=Color["Black"])
         self.label = ttk.Label(self, background= Color["White"], anchor="nw", style="Menu.TLabel", text= "Select Controller or Instrument")
         self.label.grid(row=0, column=0, padx=5, pady=20)
 
@@ -129,10 +148,9 @@ class Main(ttk.Frame):
         #DeviceFrame is a nested list where it contains :
         #   Device_Label : i.e. temperature
         #   Device_Image : i.e. mfc-image
-        #   Devoce_Statis_Label
-        #   Device_Status_String : i.e. On or off
+        #   Devoce_Statis_Label : i.e. On or off, set with setDeviceStatus
         self.makeDevices()
-        self.columnconfigure((0, 1, 2, 3, 4, 5), uniform="a")
+        self.columnconfigure(tuple(range(len(DEVICES))), uniform="a")
 
     def create_temp(self):
         if self.temp_connection_window is None or not self.temp_connection_window.winfo_exists():
@@ -140,41 +158,51 @@ class Main(ttk.Frame):
         else:
             self.temp_connection_window.lift()
             self.temp_connection_window.focus()
-    def makeDevices(self):
-        s = ttk.Style()
-        s.configure("Main.TButton", font=("TimesNewRoman", 12), foreground=Color["Black"])
-        s.configure("MainDeviceTitle.TLabel", font=("TimesNewRoman", 14, "bold"), foreground=Color["Black"])
-        s.configure("MainDeviceImage.TLabel", font=("Helvetica", 18), foreground=Color["White"], background=Color["Black"])
-
-        #Label Name, Image, Click function
-        Devices = [
-            ("Temperature", ImageTk.PhotoImage(Image.open(r"Images_svg/Temperature.png")), self.create_temp),
-            ("Mass Flow", ImageTk.PhotoImage(Image.open(r"Images_svg/Mass Flow.png")), lambda: print("Mass Flow")),
-            ("Humidity", ImageTk.PhotoImage(Image.open(r"Images_svg/Humidity.png")), lambda: print("Humidity")),
-            ("Pressure", ImageTk.PhotoImage(Image.open(r"Images_svg/Pressure.png")), lambda: print("Pressure")),
-            ("Measure", ImageTk.PhotoImage(Image.open(r"Images_svg/Measure.png")), lambda: print("Measure")),
-            ("Sample Feeder", ImageTk.PhotoImage(Image.open(r"Images_svg/SampleFeeder.png")), lambda: print("Sample Fee der")),
-        ]
-        self.device_images = [img for _, img, _ in Devices] #Without it, images get garbage collected
+    def setDeviceStatus(self, index, on):
+        text, style = Main.STATUS_ON if on else Main.STATUS_OFF
+        self.DeviceFrame[2][index].config(text=text, style=style)
 
-        labels = []
-        deviceImages = []
-        onOffLabel = []
-        onOffStatus = [StringVar(value = "Off") for x in range(len(Devices))]
-
-        for i, (labelText, labelImage, command) in enumerate(Devices):
-            labels.append(ttk.Label(self, text=labelText, style="MainDeviceTitle.TLabel"))
-            deviceImages.append(ttk.Button(self, image=labelImage, command=command))
-            onOffLabel.append(ttk.Label(self, width=17, textvariable=onOffStatus[i], style="MainDeviceImage.TLabel"))
-        self.DeviceFrame = labels, deviceImages, onOffLabel, onOffStatus
-
-        for i in range(len(self.DeviceFrame[0])):
-            self.DeviceFrame[0][i].grid(row=1, column=i, pady=(15, 25))
-            self.DeviceFrame[1][i].grid(row=2, column=i)
-            self.DeviceFrame[2][i].grid(row=3, column=i)
+    def makeDevices(self):
+        #the buttons start with an empty image of the tile size, the real images are decoded only after the frame
+        #has been drawn for the first time (see onFirstExpose), so the decoding does not hold up the first paint
+        #each placeholder takes its size from the image file header, so the row keeps its layout when the images arrive
+        n = len(DEVICES)
+        labels = [None] * n
+        deviceImages = [None] * n
+        onOffLabel = [None] * n
+        self.placeholders = [None] * n
+
+        for i, device in enumerate(DEVICES):
+            if device.command is None:
+                command = lambda label=device.label: print(label)
+            else:
+                command = getattr(self, device.command)
+            width, height = imageSize(os.path.join(ASSET_DIR, device.imagePath))
+            self.placeholders[i] = PhotoImage(width=width, height=height)
+            labels[i] = ttk.Label(self, text=device.label, style="MainDeviceTitle.TLabel")
+            deviceImages[i] = ttk.Button(self, image=self.placeholders[i], command=command)
+            onOffLabel[i] = ttk.Label(self, width=17, text=Main.STATUS_OFF[0], style="MainDeviceImage.TLabel")
+        self.DeviceFrame = labels, deviceImages, onOffLabel
+
+        gridRow(self.DeviceFrame[0], 1, pady=(15, 25))
+        gridRow(self.DeviceFrame[1], 2)
+        gridRow(self.DeviceFrame[2], 3)
+
+        self.exposeBinding = self.bind("<Expose>", self.onFirstExpose, add="+")
+
+    def onFirstExpose(self, event):
+        #one-shot: the images are loaded once, from the event loop right after the first paint
+        self.unbind("<Expose>", self.exposeBinding)
+        self.after(1, self.loadDeviceImages)
+
+    def loadDeviceImages(self):
+        for button, device in zip(self.DeviceFrame[1], DEVICES):
+            button.image = loadPhoto(os.path.join(ASSET_DIR, device.imagePath)) #Without it, images get garbage collected
+            button.config(image=button.image)
 
 if __name__ == "__main__":
     app = APP("Nextron Program", (1500, 750))
+    app.mainloop()
 
 
 
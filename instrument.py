@@ -1,24 +1,54 @@
+import asyncio
+import binascii
+import functools
 import os
 import serial
+from array import array
+from contextlib import contextmanager
 import struct
 import sys
+import threading
 import time
 
-if sys.version > '3':
-    import binascii
-
-# Allow long also in Python3
-# http://python3porting.com/noconv.html
-if sys.version > '3':
-    long = int
+try:
+    from fastcrc import crc16 as _fastcrc16  # Optional C implementation of the CRC calculation
+except ImportError:
+    _fastcrc16 = None
 
 _NUMBER_OF_BYTES_PER_REGISTER = 2
 _SECONDS_TO_MILLISECONDS = 1000
-_ASCII_HEADER = ':'
-_ASCII_FOOTER = '\r\n'
+_SECONDS_TO_NANOSECONDS = 1000000000
+_MILLISECONDS_TO_NANOSECONDS = 1000000
+_MINIMUM_SLEEP_NANOSECONDS = 200000  # Shorter remaining silent periods are not worth a sleep call
+
+_FAST = not __debug__
+"""Skip re-validation of arguments already checked by the calling facade (when running with ``python -O``)."""
+_VALIDATE = True
+"""Check arguments in the ``_check*`` helpers. Set to :const:`False` to skip the type and range checks
+of values, when all calls are known to be valid. Independent of ``python -O``. The mode, address and
+function code checks and the checks of the responses are always done."""
+_NUMERICAL_TYPES = frozenset((int, float))  # Exact types accepted by the fast path in _checkNumerical()
+_ASCII_HEADER = b':'
+_ASCII_FOOTER = b'\r\n'
+
+# Precompiled struct formats for the content conversion functions
+_U16_BE = struct.Struct('>H')  # Unsigned short (2 bytes)
+_S16_BE = struct.Struct('>h')  # (Signed) short (2 bytes)
+_U16_LE = struct.Struct('<H')
+_S16_LE = struct.Struct('<h')
+_U32_BE = struct.Struct('>L')  # Unsigned long (4 bytes)
+_S32_BE = struct.Struct('>l')  # (Signed) long (4 bytes)
+_F32_BE = struct.Struct('>f')  # Float (4 bytes)
+_F64_BE = struct.Struct('>d')  # Double (8 bytes)
+_READ_REQUEST = struct.Struct('>BBHH')  # Subordinate address, function code, register address, number of registers
+_WRITE_RESPONSE_HEADER = struct.Struct('>HH')  # Register address, and write data or number of registers
+_WRITE_MULTIPLE_HEADER = struct.Struct('>HHB')  # Register address, number of registers or bits, byte count
+_REGISTER_ARRAY_STRUCTS = {}  # Unsigned INT16 arrays, keyed by number of registers. See _registerArrayStruct()
 
 # Several instrument instances can share the same serialport
 _SERIALPORTS = {}
+_SERIALPORT_LOCKS = {}
+_SERIALPORTS_LOCK = threading.Lock()  # Guards _SERIALPORTS and _SERIALPORT_LOCKS while instruments are created
 _LATEST_READ_TIMES = {}
 
 ####################
@@ -40,8 +70,8 @@ STOPBITS = 1
 TIMEOUT  = 0.05
 """Default value for the timeout value in seconds (float)."""
 
-CLOSE_PORT_AFTER_EACH_CALL = True
-"""Default value for port closure setting."""
+CLOSE_PORT_AFTER_EACH_CALL = False
+"""Default value for port closure setting. The port is kept open between calls, use :meth:`Instrument.close` to release it."""
 
 #####################
 ## Named constants ##
@@ -50,6 +80,33 @@ CLOSE_PORT_AFTER_EACH_CALL = True
 MODE_RTU   = 'rtu'
 MODE_ASCII = 'ascii'
 
+CLOSE_MODE_FLUSH = 'flush'  # Keep the port open, discard stale input before each request
+CLOSE_MODE_CLOSE = 'close'  # Close the port after each call
+CLOSE_MODE_NONE  = 'none'   # Keep the port open, leave the input buffer alone
+
+_ALL_PAYLOADFORMATS = ('long', 'float', 'string', 'register', 'registers')
+
+_FC_INFO = {
+    1:  {'default_format': None,       'allowed_formats': (None,),              'single_register': True,  'needs_value': False},
+    2:  {'default_format': None,       'allowed_formats': (None,),              'single_register': True,  'needs_value': False},
+    3:  {'default_format': 'register', 'allowed_formats': _ALL_PAYLOADFORMATS, 'single_register': False, 'needs_value': False},
+    4:  {'default_format': 'register', 'allowed_formats': _ALL_PAYLOADFORMATS, 'single_register': False, 'needs_value': False},
+    5:  {'default_format': None,       'allowed_formats': (None,),              'single_register': True,  'needs_value': True},
+    6:  {'default_format': 'register', 'allowed_formats': _ALL_PAYLOADFORMATS, 'single_register': True,  'needs_value': True},
+    15: {'default_format': None,       'allowed_formats': (None,),              'single_register': True,  'needs_value': True},
+    16: {'default_format': 'register', 'allowed_formats': _ALL_PAYLOADFORMATS, 'single_register': False, 'needs_value': True},
+}
+"""Input rules per supported function code, used by :meth:`Instrument._genericCommand`."""
+
+_CONTIGUOUS_FORMATS = {
+    'u16': _U16_BE,
+    's16': _S16_BE,
+    'long': _U32_BE,
+    'slong': _S32_BE,
+    'float': _F32_BE,
+}
+"""Decoders for the value kinds in :meth:`Instrument.read_registers_contiguous`."""
+
 ##############################
 ## Modbus instrument object ##
 ##############################
@@ -66,12 +123,14 @@ class Instrument():
     """
 
     def __init__(self, port, subordinateaddress, mode=MODE_RTU):
-        if port not in _SERIALPORTS or not _SERIALPORTS[port]:
-            self.serial = _SERIALPORTS[port] = serial.Serial(port=port, baudrate=BAUDRATE, parity=PARITY, bytesize=BYTESIZE, stopbits=STOPBITS, timeout=TIMEOUT)
-        else:
-            self.serial = _SERIALPORTS[port]
-            if self.serial.port is None:
-                self.serial.open()
+        with _SERIALPORTS_LOCK:
+            if port not in _SERIALPORTS or not _SERIALPORTS[port]:
+                self.serial = _SERIALPORTS[port] = serial.Serial(port=port, baudrate=BAUDRATE, parity=PARITY, bytesize=BYTESIZE, stopbits=STOPBITS, timeout=TIMEOUT)
+            else:
+                self.serial = _SERIALPORTS[port]
+                if not self.serial.is_open:
+                    self.serial.open()
+            portlock = _SERIALPORT_LOCKS.setdefault(port, threading.RLock())
         """The serial port object as defined by the pySerial module. Created by the constructor.
 
         Attributes:
@@ -89,6 +148,9 @@ class Instrument():
                 - Defaults to :data:`TIMEOUT`.
         """
 
+        self._lock = portlock
+        """Reentrant lock shared by all instruments on the same serial port, held by :meth:`_portSession`."""
+
         self.address = subordinateaddress
         """Subordinate address (int). Most often set by the constructor (see the class documentation). """
 
@@ -101,28 +163,71 @@ class Instrument():
         self.debug = False
         """Set this to :const:`True` to print the communication details. Defaults to :const:`False`."""
 
-        self.close_port_after_each_call = CLOSE_PORT_AFTER_EACH_CALL
-        """If this is :const:`True`, the serial port will be closed after each call. Defaults to :data:`CLOSE_PORT_AFTER_EACH_CALL`. To change it, set the value ``minimalmodbus.CLOSE_PORT_AFTER_EACH_CALL=True`` ."""
+        self.close_mode = CLOSE_MODE_CLOSE if CLOSE_PORT_AFTER_EACH_CALL else CLOSE_MODE_FLUSH
+        """What happens to the serial port around each call: :data:`CLOSE_MODE_FLUSH`, :data:`CLOSE_MODE_CLOSE` or
+        :data:`CLOSE_MODE_NONE`. Defaults to :data:`CLOSE_MODE_FLUSH`, or :data:`CLOSE_MODE_CLOSE` if
+        :data:`CLOSE_PORT_AFTER_EACH_CALL` is :const:`True`.
 
-        self.precalculate_read_size = False
-        """If this is :const:`False`, the serial port reads until timeout
-        instead of just reading a specific number of bytes. Defaults to :const:`True`.
+        Flushing the input buffer gives each request a clean start without the cost of reopening the port.
+        """
+
+        self.precalculate_read_size = True
+        """If this is :const:`True`, the expected response length is calculated from the request
+        and the serial port returns as soon as that many bytes have arrived. If it is :const:`False`,
+        the serial port reads until timeout. Defaults to :const:`True`.
+
+        An exception response from the subordinate is shorter than predicted, so it is
+        returned after the timeout, as before.
 
         New in version 0.5.
         """
 
-        if  self.close_port_after_each_call:
+        self.cache_ttl = 0.0
+        """Time in seconds that read results are reused for, without talking to the subordinate.
+        Defaults to 0.0, which disables the cache. Writes through this instrument invalidate
+        the cached reads of the registers or bits written to.
+        """
+
+        self._cache = {}
+        """Read results by (functioncode, registeraddress, numberOfRegisters, payloadformat, signed, numberOfDecimals).
+        The values are (time.monotonic() timestamp, result) tuples."""
+
+        if  self.close_mode == CLOSE_MODE_CLOSE:
+            self.serial.close()
+
+    @property
+    def close_port_after_each_call(self):
+        """If this is :const:`True`, the serial port will be closed after each call.
+
+        Kept for compatibility, it is the same as ``close_mode == CLOSE_MODE_CLOSE``. Setting it
+        to :const:`False` selects :data:`CLOSE_MODE_FLUSH`.
+        """
+        return self.close_mode == CLOSE_MODE_CLOSE
+
+    @close_port_after_each_call.setter
+    def close_port_after_each_call(self, value):
+        self.close_mode = CLOSE_MODE_CLOSE if value else CLOSE_MODE_FLUSH
+
+    def close(self):
+        """Close the serial port.
+
+        The port is shared by all instruments using the same port name. It is opened
+        again automatically by the next call from any of them. Waits for a transaction
+        that is running on the port to finish.
+
+        """
+        with self._lock:
             self.serial.close()
 
     def __repr__(self):
         """String representation of the :class:`.Instrument` object."""
-        return "{}.{}<id=0x{:x}, address={}, mode={}, close_port_after_each_call={}, precalculate_read_size={}, debug={}, serial={}>".format(
+        return "{}.{}<id=0x{:x}, address={}, mode={}, close_mode={}, precalculate_read_size={}, debug={}, serial={}>".format(
             self.__module__,
             self.__class__.__name__,
             id(self),
             self.address,
             self.mode,
-            self.close_port_after_each_call,
+            self.close_mode,
             self.precalculate_read_size,
             self.debug,
             self.serial,
@@ -171,7 +276,7 @@ class Instrument():
         self._genericCommand(functioncode, registeraddress, value)
 
 
-    def read_register(self, registeraddress, numberOfDecimals=0, functioncode=3, signed=False):
+    def read_register(self, registeraddress, numberOfDecimals=0, functioncode=3, signed=False, use_cache=True):
         """Read an integer from one 16-bit register in the subordinate, possibly scaling it.
 
         The subordinate register can hold integer values in the range 0 to 65535 ("Unsigned INT16").
@@ -181,6 +286,8 @@ class Instrument():
             * numberOfDecimals (int): The number of decimals for content conversion.
             * functioncode (int): Modbus function code. Can be 3 or 4.
             * signed (bool): Whether the data should be interpreted as unsigned or signed.
+            * use_cache (bool): Set this to :const:`False` to always ask the subordinate, also when
+              :attr:`Instrument.cache_ttl` is set.
 
         If a value of 77.0 is stored internally in the subordinate register as 770, then use ``numberOfDecimals=1``
         which will divide the received data by 10 before returning the value.
@@ -213,7 +320,12 @@ class Instrument():
         _checkFunctioncode(functioncode, [3, 4])
         _checkInt(numberOfDecimals, minvalue=0, maxvalue=10, description='number of decimals')
         _checkBool(signed, description='signed')
-        return self._genericCommand(functioncode, registeraddress, numberOfDecimals=numberOfDecimals, signed=signed)
+        _checkBool(use_cache, description='use_cache')
+        if numberOfDecimals == 0 and self.mode == MODE_RTU and self.precalculate_read_size and \
+                (not use_cache or self.cache_ttl <= 0):
+            return self._readSingleRegisterFast(registeraddress, functioncode, signed)
+        return self._genericCommand(functioncode, registeraddress, numberOfDecimals=numberOfDecimals, signed=signed, \
+            use_cache=use_cache)
 
 
     def write_register(self, registeraddress, value, numberOfDecimals=0, functioncode=16, signed=False):
@@ -295,7 +407,7 @@ class Instrument():
 
         Args:
             * registeraddress (int): The subordinate register start address  (use decimal numbers, not hex).
-            * value (int or long): The value to store in the subordinate.
+            * value (int): The value to store in the subordinate.
             * signed (bool): Whether the data should be interpreted as unsigned or signed.
 
         Returns:
@@ -456,6 +568,71 @@ class Instrument():
             numberOfRegisters=numberOfRegisters, payloadformat='registers')
 
 
+    def read_registers_contiguous(self, registeraddress, numberOfRegisters, specs, functioncode=3):
+        """Read a block of consecutive registers in one call, and decode several values from it.
+
+        Args:
+            * registeraddress (int): The subordinate register start address (use decimal numbers, not hex).
+            * numberOfRegisters (int): The number of registers to read.
+            * specs (list of tuples): ``(offset, kind)`` for each value, where ``offset`` is the register
+              offset from ``registeraddress`` and ``kind`` is one of the keys in :data:`_CONTIGUOUS_FORMATS`.
+            * functioncode (int): Modbus function code. Can be 3 or 4.
+
+        ========= ============================= =========
+        ``kind``  Data type                     Registers
+        ========= ============================= =========
+        'u16'     Unsigned INT16                1
+        's16'     INT16                         1
+        'long'    Unsigned INT32                2
+        'slong'   INT32                         2
+        'float'   Single precision (binary32)   2
+        ========= ============================= =========
+
+        This replaces several calls to :meth:`.read_register`, :meth:`.read_long` etc
+        for registers next to each other with a single request to the subordinate.
+
+        Returns:
+            The decoded values (a list), in the same order as ``specs``.
+
+        Raises:
+            ValueError, TypeError, IOError
+
+        """
+        _checkFunctioncode(functioncode, [3, 4])
+        _checkRegisteraddress(registeraddress)
+        _checkInt(numberOfRegisters, minvalue=1, maxvalue=125, description='number of registers')
+
+        formats = []
+        for offset, kind in specs:
+            if kind not in _CONTIGUOUS_FORMATS:
+                raise ValueError('Unknown value kind. Given: {0!r}'.format(kind))
+            formatter = _CONTIGUOUS_FORMATS[kind]
+            registersForKind = formatter.size // _NUMBER_OF_BYTES_PER_REGISTER
+            if type(offset) is not int:
+                raise TypeError('The register offset must be an integer. Given: {0!r}'.format(offset))
+            if offset < 0:
+                raise ValueError('The register offset for a {0!r} value must not be negative. Given: {1}'.format( \
+                    kind, offset))
+            if offset + registersForKind > numberOfRegisters:
+                raise ValueError('A {0!r} value at register offset {1} needs {2} register(s), '.format( \
+                    kind, offset, registersForKind) + \
+                    'which does not fit in the {0} register(s) read.'.format(numberOfRegisters))
+            formats.append((offset * _NUMBER_OF_BYTES_PER_REGISTER, formatter))
+
+        ## Talk to the subordinate directly, to get the register bytes without a text round-trip ##
+        payloadToSubordinate = _U16_BE.pack(registeraddress) + _U16_BE.pack(numberOfRegisters)
+        payloadFromSubordinate = self._performCommand(functioncode, payloadToSubordinate)
+
+        _checkResponseByteCount(payloadFromSubordinate)
+        registerdata = payloadFromSubordinate[1:]
+        numberOfRegisterBytes = numberOfRegisters * _NUMBER_OF_BYTES_PER_REGISTER
+        if len(registerdata) != numberOfRegisterBytes:
+            raise ValueError('The registerdata length does not match number of register bytes. ' + \
+                'Given {0!r} and {1!r}.'.format(len(registerdata), numberOfRegisterBytes))
+
+        return [formatter.unpack_from(registerdata, byteoffset)[0] for byteoffset, formatter in formats]
+
+
     def write_registers(self, registeraddress, values):
         """Write integers to 16-bit registers in the subordinate.
 
@@ -486,13 +663,91 @@ class Instrument():
 
         self._genericCommand(16, registeraddress, values, numberOfRegisters=len(values), payloadformat='registers')
 
+    def compile_poll(self, functioncode, registeraddress, numberOfRegisters=1, payloadformat='register', signed=False):
+        """Prepare a repeated read of the same registers, and return a function that performs it.
+
+        Args:
+            * functioncode (int): Modbus function code. Can be 3 or 4.
+            * registeraddress (int): The subordinate register start address (use decimal numbers, not hex).
+            * numberOfRegisters (int): The number of registers to read.
+            * payloadformat (str): 'register', 'registers', 'long', 'float' or 'string', as for :meth:`_genericCommand`.
+            * signed (bool): Whether the data should be interpreted as unsigned or signed. Only for 'register' and 'long'.
+
+        The request message (including CRC or LRC) and the response length are calculated
+        once, for the current :attr:`address` and :attr:`mode`. Each call of the returned
+        function only talks to the subordinate, validates the response and decodes it.
+        As in :meth:`_performCommand`, the precalculated response length is only used
+        while :attr:`precalculate_read_size` is :const:`True`::
+
+            poll = instrument.compile_poll(3, 1000)
+            while True:
+                value = poll()
+
+        Returns:
+            A function without arguments, returning the same as the corresponding read method.
+
+        Raises:
+            ValueError, TypeError (here), and ValueError, TypeError, IOError (from the returned function)
+
+        """
+        DEFAULT_NUMBER_OF_BYTES_TO_READ = 1000
+
+        _checkFunctioncode(functioncode, [3, 4])
+        _checkRegisteraddress(registeraddress)
+        _checkInt(numberOfRegisters, minvalue=1, maxvalue=125, description='number of registers')
+        _checkBool(signed, description='signed')
+
+        if payloadformat == 'register':
+            _checkInt(numberOfRegisters, minvalue=1, maxvalue=1, description='number of registers')
+            decode = lambda registerdata: _twoByteStringToNum(registerdata, signed=signed)
+        elif payloadformat == 'registers':
+            decode = lambda registerdata: _bytestringToValuelist(registerdata, numberOfRegisters)
+        elif payloadformat == 'long':
+            if numberOfRegisters != 2:
+                raise ValueError('Wrong number of registers! Given value is {0!r}'.format(numberOfRegisters))
+            decode = lambda registerdata: _bytestringToLong(registerdata, signed, numberOfRegisters)
+        elif payloadformat == 'float':
+            if numberOfRegisters not in [2, 4]:
+                raise ValueError('Wrong number of registers! Given value is {0!r}'.format(numberOfRegisters))
+            decode = lambda registerdata: _bytestringToFloat(registerdata, numberOfRegisters)
+        elif payloadformat == 'string':
+            decode = lambda registerdata: _bytestringToTextstring(registerdata, numberOfRegisters)
+        else:
+            raise ValueError('Wrong payload format for compile_poll. Given: {0!r}'.format(payloadformat))
+
+        if signed and payloadformat not in ['register', 'long']:
+            raise ValueError('The "signed" parameter can not be used for this data format. ' + \
+                'Given format: {0!r}.'.format(payloadformat))
+
+        address = self.address
+        mode = self.mode
+        payloadToSubordinate = _U16_BE.pack(registeraddress) + _U16_BE.pack(numberOfRegisters)
+        message = _embedPayload(address, mode, functioncode, payloadToSubordinate)
+        number_of_bytes_to_read = _predictResponseSize(mode, functioncode, payloadToSubordinate)
+        numberOfRegisterBytes = numberOfRegisters * _NUMBER_OF_BYTES_PER_REGISTER
+
+        def poll():
+            if self.precalculate_read_size:
+                response = self._communicate(message, number_of_bytes_to_read)
+            else:
+                response = self._communicate(message, DEFAULT_NUMBER_OF_BYTES_TO_READ)
+            payloadFromSubordinate = _extractPayload(response, address, mode, functioncode)
+            _checkResponseByteCount(payloadFromSubordinate)
+            registerdata = payloadFromSubordinate[1:]
+            if len(registerdata) != numberOfRegisterBytes:
+                raise ValueError('The registerdata length does not match number of register bytes. ' + \
+                    'Given {0!r} and {1!r}.'.format(len(registerdata), numberOfRegisterBytes))
+            return decode(registerdata)
+
+        return poll
+
     #####################
     ## Generic command ##
     #####################
 
 
     def _genericCommand(self, functioncode, registeraddress, value=None, \
-            numberOfDecimals=0, numberOfRegisters=1, signed=False, payloadformat=None):
+            numberOfDecimals=0, numberOfRegisters=1, signed=False, payloadformat=None, use_cache=True):
         """Generic command for reading and writing registers and bits.
 
         Args:
@@ -503,6 +758,7 @@ class Instrument():
             * numberOfRegisters (int): The number of registers to read/write. Only certain values allowed, depends on payloadformat.
             * signed (bool): Whether the data should be interpreted as unsigned or signed. Only for a single register or for payloadformat='long'.
             * payloadformat (None or string): None, 'long', 'float', 'string', 'register', 'registers'. Not necessary for single registers or bits.
+            * use_cache (bool): Whether a read may be answered from the cache, see :attr:`Instrument.cache_ttl`.
 
         If a value of 77.0 is stored internally in the subordinate register as 770,
         then use ``numberOfDecimals=1`` which will divide the received data by 10
@@ -520,46 +776,41 @@ class Instrument():
         NUMBER_OF_BITS = 1
         NUMBER_OF_BYTES_FOR_ONE_BIT = 1
         NUMBER_OF_BYTES_BEFORE_REGISTERDATA = 1
-        ALL_ALLOWED_FUNCTIONCODES = list(range(1, 7)) + [15, 16]  # To comply with both Python2 and Python3
         MAX_NUMBER_OF_REGISTERS = 255
 
         # Payload format constants, so datatypes can be told apart.
         # Note that bit datatype not is included, because it uses other functioncodes.
+        # The same names are listed in _ALL_PAYLOADFORMATS and _FC_INFO.
         PAYLOADFORMAT_LONG      = 'long'
         PAYLOADFORMAT_FLOAT     = 'float'
         PAYLOADFORMAT_STRING    = 'string'
         PAYLOADFORMAT_REGISTER  = 'register'
         PAYLOADFORMAT_REGISTERS = 'registers'
 
-        ALL_PAYLOADFORMATS = [PAYLOADFORMAT_LONG, PAYLOADFORMAT_FLOAT, \
-            PAYLOADFORMAT_STRING, PAYLOADFORMAT_REGISTER, PAYLOADFORMAT_REGISTERS]
-
         ## Check input values ##
-        _checkFunctioncode(functioncode, ALL_ALLOWED_FUNCTIONCODES)  # Note: The calling facade functions should validate this
+        info = _FC_INFO.get(functioncode)
+        if info is None:
+            _checkFunctioncode(functioncode, sorted(_FC_INFO))  # Note: The calling facade functions should validate this
         _checkRegisteraddress(registeraddress)
-        _checkInt(numberOfDecimals, minvalue=0, description='number of decimals')
         _checkInt(numberOfRegisters, minvalue=1, maxvalue=MAX_NUMBER_OF_REGISTERS, description='number of registers')
-        _checkBool(signed, description='signed')
+        if not _FAST:
+            _checkInt(numberOfDecimals, minvalue=0, description='number of decimals')
+            _checkBool(signed, description='signed')
 
         if payloadformat is not None:
-            if payloadformat not in ALL_PAYLOADFORMATS:
+            if payloadformat not in _ALL_PAYLOADFORMATS:
                 raise ValueError('Wrong payload format variable. Given: {0!r}'.format(payloadformat))
 
         ## Check combinations of input parameters ##
         numberOfRegisterBytes = numberOfRegisters * _NUMBER_OF_BYTES_PER_REGISTER
 
                     # Payload format
-        if functioncode in [3, 4, 6, 16] and payloadformat is None:
-            payloadformat = PAYLOADFORMAT_REGISTER
+        if payloadformat is None:
+            payloadformat = info['default_format']
 
-        if functioncode in [3, 4, 6, 16]:
-            if payloadformat not in ALL_PAYLOADFORMATS:
-                raise ValueError('The payload format is unknown. Given format: {0!r}, functioncode: {1!r}.'.\
-                    format(payloadformat, functioncode))
-        else:
-            if payloadformat is not None:
-                raise ValueError('The payload format given is not allowed for this function code. ' + \
-                    'Given format: {0!r}, functioncode: {1!r}.'.format(payloadformat, functioncode))
+        if payloadformat not in info['allowed_formats']:
+            raise ValueError('The payload format given is not allowed for this function code. ' + \
+                'Given format: {0!r}, functioncode: {1!r}.'.format(payloadformat, functioncode))
 
                     # Signed and numberOfDecimals
         if signed:
@@ -572,7 +823,7 @@ class Instrument():
                 'Given format: {0!r}.'.format(payloadformat))
 
                     # Number of registers
-        if functioncode not in [3, 4, 16] and numberOfRegisters != 1:
+        if info['single_register'] and numberOfRegisters != 1:
             raise ValueError('The numberOfRegisters is not valid for this function code. ' + \
                 'NumberOfRegisters: {0!r}, functioncode {1}.'.format(numberOfRegisters, functioncode))
 
@@ -582,15 +833,16 @@ class Instrument():
             # Note: For function code 16 there is checking also in the content conversion functions.
 
                     # Value
-        if functioncode in [5, 6, 15, 16] and value is None:
+        if info['needs_value'] and value is None:
             raise ValueError('The input value is not valid for this function code. ' + \
                 'Given {0!r} and {1}.'.format(value, functioncode))
 
-        if functioncode == 16 and payloadformat in [PAYLOADFORMAT_REGISTER, PAYLOADFORMAT_FLOAT, PAYLOADFORMAT_LONG]:
-            _checkNumerical(value, description='input value')
+        if not _FAST:
+            if functioncode == 16 and payloadformat in [PAYLOADFORMAT_REGISTER, PAYLOADFORMAT_FLOAT, PAYLOADFORMAT_LONG]:
+                _checkNumerical(value, description='input value')
 
-        if functioncode == 6 and payloadformat == PAYLOADFORMAT_REGISTER:
-            _checkNumerical(value, description='input value')
+            if functioncode == 6 and payloadformat == PAYLOADFORMAT_REGISTER:
+                _checkNumerical(value, description='input value')
 
                     # Value for string
         if functioncode == 16 and payloadformat == PAYLOADFORMAT_STRING:
@@ -606,7 +858,23 @@ class Instrument():
                 raise ValueError('The list length does not match number of registers. ' + \
                     'List: {0!r},  Number of registers: {1!r}.'.format(value, numberOfRegisters))
 
+        ## Use the cache ##
+        cachekey = None
+        if functioncode in [1, 2, 3, 4]:
+            if use_cache and self.cache_ttl > 0:
+                cachekey = (functioncode, registeraddress, numberOfRegisters, payloadformat, signed, numberOfDecimals)
+                cached = self._cache.get(cachekey)
+                if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                    if isinstance(cached[1], tuple):
+                        return list(cached[1])
+                    return cached[1]
+        elif self._cache:
+            self._invalidateCache(functioncode, registeraddress, numberOfRegisters)
+
         ## Build payload to subordinate ##
+        if functioncode in [5, 15]:
+            bitpattern = _BITPATTERN_CACHE.get((functioncode, value)) or _createBitpattern(functioncode, value)
+
         if functioncode in [1, 2]:
             payloadToSubordinate = _numToTwoByteString(registeraddress) + \
                             _numToTwoByteString(NUMBER_OF_BITS)
@@ -617,17 +885,15 @@ class Instrument():
 
         elif functioncode == 5:
             payloadToSubordinate = _numToTwoByteString(registeraddress) + \
-                            _createBitpattern(functioncode, value)
+                            bitpattern
 
         elif functioncode == 6:
             payloadToSubordinate = _numToTwoByteString(registeraddress) + \
                             _numToTwoByteString(value, numberOfDecimals, signed=signed)
 
         elif functioncode == 15:
-            payloadToSubordinate = _numToTwoByteString(registeraddress) + \
-                            _numToTwoByteString(NUMBER_OF_BITS) + \
-                            _numToOneByteString(NUMBER_OF_BYTES_FOR_ONE_BIT) + \
-                            _createBitpattern(functioncode, value)
+            payloadToSubordinate = _WRITE_MULTIPLE_HEADER.pack(registeraddress, NUMBER_OF_BITS, \
+                            NUMBER_OF_BYTES_FOR_ONE_BIT) + bitpattern
 
         elif functioncode == 16:
             if payloadformat == PAYLOADFORMAT_REGISTER:
@@ -645,11 +911,9 @@ class Instrument():
             elif payloadformat == PAYLOADFORMAT_REGISTERS:
                 registerdata = _valuelistToBytestring(value, numberOfRegisters)
 
-            assert len(registerdata) == numberOfRegisterBytes
-            payloadToSubordinate = _numToTwoByteString(registeraddress) + \
-                            _numToTwoByteString(numberOfRegisters) + \
-                            _numToOneByteString(numberOfRegisterBytes) + \
-                            registerdata
+            _checkInt(numberOfRegisterBytes, minvalue=0, maxvalue=0xFF, description='number of register bytes')
+            payloadToSubordinate = _WRITE_MULTIPLE_HEADER.pack(registeraddress, numberOfRegisters, \
+                            numberOfRegisterBytes) + registerdata
 
         ## Communicate ##
         payloadFromSubordinate = self._performCommand(functioncode, payloadToSubordinate)
@@ -659,20 +923,13 @@ class Instrument():
             _checkResponseByteCount(payloadFromSubordinate)  # response byte count
 
         if functioncode in [5, 6, 15, 16]:
-            _checkResponseRegisterAddress(payloadFromSubordinate, registeraddress)  # response register address
-
-        if functioncode == 5:
-            _checkResponseWriteData(payloadFromSubordinate, _createBitpattern(functioncode, value))  # response write data
-
-        if functioncode == 6:
-            _checkResponseWriteData(payloadFromSubordinate, \
-                _numToTwoByteString(value, numberOfDecimals, signed=signed))  # response write data
-
-        if functioncode == 15:
-            _checkResponseNumberOfRegisters(payloadFromSubordinate, NUMBER_OF_BITS)  # response number of bits
-
-        if functioncode == 16:
-            _checkResponseNumberOfRegisters(payloadFromSubordinate, numberOfRegisters)  # response number of registers
+            # The response echoes the first four bytes of the request: The register address,
+            # and the write data (function code 5 and 6) or the number of bits/registers (15 and 16).
+            receivedHeader = _parseWriteResponseHeader(payloadFromSubordinate)
+            commandedHeader = _WRITE_RESPONSE_HEADER.unpack_from(payloadToSubordinate)
+            if receivedHeader != commandedHeader:
+                raise ValueError('Wrong write response. Given register address and data {0}, but commanded is {1}. '.format( \
+                    receivedHeader, commandedHeader) + 'The data payload is: {0!r}'.format(payloadFromSubordinate))
 
         ## Calculate return value ##
         if functioncode in [1, 2]:
@@ -681,7 +938,7 @@ class Instrument():
                 raise ValueError('The registerdata length does not match NUMBER_OF_BYTES_FOR_ONE_BIT. ' + \
                     'Given {0}.'.format(len(registerdata)))
 
-            return _bitResponseToValue(registerdata)
+            result = _bitResponseToValue(registerdata)
 
         if functioncode in [3, 4]:
             registerdata = payloadFromSubordinate[NUMBER_OF_BYTES_BEFORE_REGISTERDATA:]
@@ -690,22 +947,80 @@ class Instrument():
                     'Given {0!r} and {1!r}.'.format(len(registerdata), numberOfRegisterBytes))
 
             if payloadformat == PAYLOADFORMAT_STRING:
-                return _bytestringToTextstring(registerdata, numberOfRegisters)
+                result = _bytestringToTextstring(registerdata, numberOfRegisters)
 
             elif payloadformat == PAYLOADFORMAT_LONG:
-                return _bytestringToLong(registerdata, signed, numberOfRegisters)
+                result = _bytestringToLong(registerdata, signed, numberOfRegisters)
 
             elif payloadformat == PAYLOADFORMAT_FLOAT:
-                return _bytestringToFloat(registerdata, numberOfRegisters)
+                result = _bytestringToFloat(registerdata, numberOfRegisters)
 
             elif payloadformat == PAYLOADFORMAT_REGISTERS:
-                return _bytestringToValuelist(registerdata, numberOfRegisters)
+                result = _bytestringToValuelist(registerdata, numberOfRegisters)
 
             elif payloadformat == PAYLOADFORMAT_REGISTER:
-                return _twoByteStringToNum(registerdata, numberOfDecimals, signed=signed)
+                result = _twoByteStringToNum(registerdata, numberOfDecimals, signed=signed)
+
+            else:
+                raise ValueError('Wrong payloadformat for return value generation. ' + \
+                    'Given {0}'.format(payloadformat))
+
+        if functioncode in [1, 2, 3, 4]:
+            if cachekey is not None:
+                # Lists are stored as tuples, so the caller can not modify the cached value
+                self._cache[cachekey] = (time.monotonic(), tuple(result) if isinstance(result, list) else result)
+            return result
 
-            raise ValueError('Wrong payloadformat for return value generation. ' + \
-                'Given {0}'.format(payloadformat))
+
+    def _readSingleRegisterFast(self, registeraddress, functioncode, signed):
+        """Read one unscaled register in RTU mode, without going through :meth:`_genericCommand`.
+
+        Args:
+            * registeraddress (int): The subordinate register address (use decimal numbers, not hex).
+            * functioncode (int): Modbus function code. Can be 3 or 4.
+            * signed (bool): Whether the data should be interpreted as unsigned or signed.
+
+        The request is packed in one call, and the response (always 7 bytes) is
+        validated by :func:`_extractPayload` as usual.
+
+        Returns:
+            The register data (int).
+
+        Raises:
+            ValueError, TypeError, IOError
+
+        """
+        NUMBER_OF_RESPONSE_BYTES = 7
+        NUMBER_OF_PAYLOAD_BYTES = 3
+
+        _checkSubordinateaddress(self.address)
+        _checkRegisteraddress(registeraddress)
+
+        message = _frameRtu(_READ_REQUEST.pack(self.address, functioncode, registeraddress, 1))
+
+        response = self._communicate(message, NUMBER_OF_RESPONSE_BYTES)
+        payloadFromSubordinate = _extractPayload(response, self.address, MODE_RTU, functioncode)
+
+        _checkResponseByteCount(payloadFromSubordinate)
+        if len(payloadFromSubordinate) != NUMBER_OF_PAYLOAD_BYTES:
+            raise ValueError('The registerdata length does not match one register. ' + \
+                'Given {0!r}.'.format(payloadFromSubordinate))
+
+        return _unpack(_S16_BE if signed else _U16_BE, payloadFromSubordinate[1:])
+
+
+    def _invalidateCache(self, functioncode, registeraddress, numberOfRegisters):
+        """Drop the cached reads that overlap the registers or bits written by *functioncode*.
+
+        Writes with function code 5 or 15 affect reads with function code 1 or 2, and
+        writes with function code 6 or 16 affect reads with function code 3 or 4.
+
+        """
+        readcodes = (1, 2) if functioncode in [5, 15] else (3, 4)
+        lastaddress = registeraddress + numberOfRegisters
+        for key in list(self._cache):
+            if key[0] in readcodes and key[1] < lastaddress and registeraddress < key[1] + key[2]:
+                self._cache.pop(key, None)
 
     ##########################################
     ## Communication implementation details ##
@@ -717,10 +1032,10 @@ class Instrument():
 
         Args:
             * functioncode (int): The function code for the command to be performed. Can for example be 'Write register' = 16.
-            * payloadToSubordinate (str): Data to be transmitted to the subordinate (will be embedded in subordinateaddress, CRC etc)
+            * payloadToSubordinate (bytes): Data to be transmitted to the subordinate (will be embedded in subordinateaddress, CRC etc)
 
         Returns:
-            The extracted data payload from the subordinate (a string). It has been stripped of CRC etc.
+            The extracted data payload from the subordinate (bytes). It has been stripped of CRC etc.
 
         Raises:
             ValueError, TypeError.
@@ -732,8 +1047,9 @@ class Instrument():
         """
         DEFAULT_NUMBER_OF_BYTES_TO_READ = 1000
 
-        _checkFunctioncode(functioncode, None)
-        _checkString(payloadToSubordinate, description='payload')
+        if not _FAST:
+            _checkFunctioncode(functioncode, None)
+            _checkBytes(payloadToSubordinate, description='payload')
 
         # Build message
         message = _embedPayload(self.address, self.mode, functioncode, payloadToSubordinate)
@@ -757,29 +1073,48 @@ class Instrument():
         return payloadFromSubordinate
 
 
+    @contextmanager
+    def _portSession(self):
+        """Hold the serial port for one write and read.
+
+        Acquires the lock shared by all instruments on the port and opens the port if needed.
+        Then, depending on :attr:`Instrument.close_mode`, the input buffer is flushed first or
+        the port is closed afterwards. The lock is reentrant, so sessions may be nested by the same thread.
+
+        """
+        with self._lock:
+            if not self.serial.is_open:
+                self.serial.open()
+            elif self.close_mode == CLOSE_MODE_FLUSH:
+                self.serial.reset_input_buffer()
+            try:
+                yield self.serial
+            finally:
+                if self.close_mode == CLOSE_MODE_CLOSE:
+                    self.serial.close()
+
+
     def _communicate(self, message, number_of_bytes_to_read):
         """Talk to the subordinate via a serial port.
 
         Args:
-            message (str): The raw message that is to be sent to the subordinate.
+            message (bytes): The raw message that is to be sent to the subordinate.
             number_of_bytes_to_read (int): number of bytes to read
 
         Returns:
-            The raw data (string) returned from the subordinate.
+            The raw data (bytes) returned from the subordinate.
 
         Raises:
             TypeError, ValueError, IOError
 
-        Note that the answer might have strange ASCII control signs, which
-        makes it difficult to print it in the promt (messes up a bit).
-        Use repr() to make the string printable (shows ascii values for control signs.)
+        Use repr() to make the answer printable (shows ascii values for control signs.)
 
         Will block until reaching *number_of_bytes_to_read* or timeout.
 
         If the attribute :attr:`Instrument.debug` is :const:`True`, the communication details are printed.
 
-        If the attribute :attr:`Instrument.close_port_after_each_call` is :const:`True` the
-        serial port is closed after each call.
+        The attribute :attr:`Instrument.close_mode` selects whether the input buffer is
+        flushed before the request, or the serial port is closed after each call.
 
         Timing::
 
@@ -793,69 +1128,57 @@ class Instrument():
                                                   |       |
                              Roundtrip time  ---->|-------|<--
 
-        The resolution for Python's time.time() is lower on Windows than on Linux.
-        It is about 16 ms on Windows according to
-        http://stackoverflow.com/questions/157359/accurate-timestamping-in-python
+        The timing uses :func:`time.monotonic_ns`, which is not affected by changes
+        of the system clock. The latest read time is stored per port in :data:`_LATEST_READ_TIMES`.
 
-        For Python3, the information sent to and from pySerial should be of the type bytes.
-        This is taken care of automatically by MinimalModbus.
+        The information is sent to and from pySerial as bytes, without conversion.
 
         """
 
-        _checkString(message, minlength=1, description='message')
-        _checkInt(number_of_bytes_to_read)
+        if not _FAST:
+            _checkBytes(message, minlength=1, description='message')
+            _checkInt(number_of_bytes_to_read)
 
         if self.debug:
             _print_out('\nMinimalModbus debug mode. Writing to instrument (expecting {} bytes back): {!r}'. \
                 format(number_of_bytes_to_read, message))
 
-        if self.close_port_after_each_call:
-            self.serial.open()
-
-        #self.serial.flushInput() TODO
+        # Only one instrument at a time may talk on a shared port
+        with self._portSession():
+            # Sleep to make sure 3.5 character times have passed
+            minimum_silent_period   = _calculate_minimum_silent_period(self.serial.baudrate)
 
-        if sys.version_info[0] > 2:
-            message = bytes(message, encoding='latin1')  # Convert types to make it Python3 compatible
+            # Monotonic integer nanoseconds, so clock adjustments can not cause a wrong or missing sleep
+            time_since_read_ns      = time.monotonic_ns() - _LATEST_READ_TIMES.get(self.serial.port, 0)
+            sleep_time_ns           = int(minimum_silent_period * _SECONDS_TO_NANOSECONDS) - time_since_read_ns
 
-        # Sleep to make sure 3.5 character times have passed
-        minimum_silent_period   = _calculate_minimum_silent_period(self.serial.baudrate)
-        time_since_read         = time.time() - _LATEST_READ_TIMES.get(self.serial.port, 0)
-
-        if time_since_read < minimum_silent_period:
-            sleep_time = minimum_silent_period - time_since_read
-
-            if self.debug:
-                template = 'MinimalModbus debug mode. Sleeping for {:.1f} ms. ' + \
-                        'Minimum silent period: {:.1f} ms, time since read: {:.1f} ms.'
+            if sleep_time_ns > _MINIMUM_SLEEP_NANOSECONDS:
+                if self.debug:
+                    template = 'MinimalModbus debug mode. Sleeping for {:.1f} ms. ' + \
+                            'Minimum silent period: {:.1f} ms, time since read: {:.1f} ms.'
+                    text = template.format(
+                        sleep_time_ns / _MILLISECONDS_TO_NANOSECONDS,
+                        minimum_silent_period * _SECONDS_TO_MILLISECONDS,
+                        time_since_read_ns / _MILLISECONDS_TO_NANOSECONDS)
+                    _print_out(text)
+
+                time.sleep(sleep_time_ns / _SECONDS_TO_NANOSECONDS)
+
+            elif self.debug:
+                template = 'MinimalModbus debug mode. No sleep required before write. ' + \
+                    'Time since previous read: {:.1f} ms, minimum silent period: {:.2f} ms.'
                 text = template.format(
-                    sleep_time * _SECONDS_TO_MILLISECONDS,
-                    minimum_silent_period * _SECONDS_TO_MILLISECONDS,
-                    time_since_read * _SECONDS_TO_MILLISECONDS)
+                    time_since_read_ns / _MILLISECONDS_TO_NANOSECONDS,
+                    minimum_silent_period * _SECONDS_TO_MILLISECONDS)
                 _print_out(text)
 
-            time.sleep(sleep_time)
+            # Write message
+            latest_write_time_ns = time.monotonic_ns()
+            self.serial.write(message)
 
-        elif self.debug:
-            template = 'MinimalModbus debug mode. No sleep required before write. ' + \
-                'Time since previous read: {:.1f} ms, minimum silent period: {:.2f} ms.'
-            text = template.format(
-                time_since_read * _SECONDS_TO_MILLISECONDS,
-                minimum_silent_period * _SECONDS_TO_MILLISECONDS)
-            _print_out(text)
-
-        # Write message
-        latest_write_time = time.time()
-        self.serial.write(message)
-
-        # Read response
-        answer = self.serial.read(number_of_bytes_to_read)
-        _LATEST_READ_TIMES[self.serial.port] = time.time()
-
-        if self.close_port_after_each_call:
-            self.serial.close()
-
-        if sys.version_info[0] > 2:
-            answer = str(answer, encoding='latin1')  # Convert types to make it Python3 compatible
+            # Read response
+            answer = self.serial.read(number_of_bytes_to_read)
+            _LATEST_READ_TIMES[self.serial.port] = time.monotonic_ns()
 
         if self.debug:
             template = 'MinimalModbus debug mode. Response from instrument: {!r} ({} bytes), ' + \
@@ -863,7 +1186,7 @@ class Instrument():
             text = template.format(
                 answer,
                 len(answer),
-                (_LATEST_READ_TIMES.get(self.serial.port, 0) - latest_write_time) * _SECONDS_TO_MILLISECONDS,
+                (_LATEST_READ_TIMES.get(self.serial.port, 0) - latest_write_time_ns) / _MILLISECONDS_TO_NANOSECONDS,
                 self.serial.timeout * _SECONDS_TO_MILLISECONDS)
             _print_out(text)
 
@@ -872,6 +1195,54 @@ class Instrument():
 
         return answer
 
+
+class AsyncInstrument():
+    """Asyncio front end for :class:`Instrument`, for polling many instruments from one event loop.
+
+    Args:
+        * port (str): The serial port name, see :class:`Instrument`.
+        * subordinateaddress (int): Subordinate address in the range 1 to 247.
+        * mode (str): Mode selection. Can be MODE_RTU or MODE_ASCII.
+        * executor (concurrent.futures.Executor or None): Where the blocking calls run. Defaults to the loop's default executor.
+
+    The methods listed in :data:`_ASYNC_METHODS` are available as coroutines with the same
+    arguments, for example ``await instrument.read_register(289, 1)``. Each call runs the
+    blocking :class:`Instrument` method in the executor, so instruments on different serial
+    ports are polled concurrently. Instruments on the same port still take turns, as the
+    bus is half duplex.
+
+    """
+
+    def __init__(self, port, subordinateaddress, mode=MODE_RTU, executor=None):
+        self.instrument = Instrument(port, subordinateaddress, mode)
+        """The wrapped :class:`Instrument`, for settings like ``debug`` and ``serial.baudrate``."""
+
+        self.executor = executor
+
+    def __repr__(self):
+        """String representation of the :class:`.AsyncInstrument` object."""
+        return '{}.{}<instrument={!r}>'.format(self.__module__, self.__class__.__name__, self.instrument)
+
+    def __getattr__(self, name):
+        if name not in _ASYNC_METHODS:
+            raise AttributeError('{!r} object has no attribute {!r}'.format(self.__class__.__name__, name))
+        method = getattr(self.instrument, name)
+
+        @functools.wraps(method)
+        async def coroutine(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+
+        return coroutine
+
+
+_ASYNC_METHODS = frozenset([
+    'read_bit', 'write_bit', 'read_register', 'write_register', 'read_long', 'write_long',
+    'read_float', 'write_float', 'read_string', 'write_string', 'read_registers', 'write_registers',
+    'read_registers_contiguous',
+])
+"""The :class:`Instrument` methods that :class:`AsyncInstrument` exposes as coroutines."""
+
 ####################
 # Payload handling #
 ####################
@@ -884,10 +1255,10 @@ def _embedPayload(subordinateaddress, mode, functioncode, payloaddata):
         * subordinateaddress (int): The address of the subordinate.
         * mode (str): The modbus protcol mode (rtu or ascii)
         * functioncode (int): The function code for the command to be performed. Can for example be 16 (Write register).
-        * payloaddata (str): The byte string to be sent to the subordinate.
+        * payloaddata (bytes): The byte string to be sent to the subordinate.
 
     Returns:
-        The built (raw) message string for sending to the subordinate (including CRC etc).
+        The built (raw) message bytes for sending to the subordinate (including CRC etc).
 
     Raises:
         ValueError, TypeError.
@@ -902,33 +1273,62 @@ def _embedPayload(subordinateaddress, mode, functioncode, payloaddata):
     """
     _checkSubordinateaddress(subordinateaddress)
     _checkMode(mode)
-    _checkFunctioncode(functioncode, None)
-    _checkString(payloaddata, description='payload')
+    if not _FAST:
+        _checkFunctioncode(functioncode, None)
+        _checkBytes(payloaddata, description='payload')
 
-    firstPart = _numToOneByteString(subordinateaddress) + _numToOneByteString(functioncode) + payloaddata
+    firstPart = bytes((subordinateaddress, functioncode)) + payloaddata
 
     if mode == MODE_ASCII:
-        message = _ASCII_HEADER + \
-                _hexencode(firstPart) + \
-                _hexencode(_calculateLrcString(firstPart)) + \
-                _ASCII_FOOTER
+        message = _frameAscii(firstPart)
     else:
-        message = firstPart + _calculateCrcString(firstPart)
+        message = _frameRtu(firstPart)
 
     return message
 
 
+def _frameRtu(firstPart):
+    """Build an RTU mode message from the subordinateaddress + functioncode + payloaddata bytes.
+
+    Args:
+        firstPart (bytes): The bytes that the CRC is calculated from.
+
+    Returns:
+        The firstPart followed by the CRC (least significant byte first).
+
+    This is the single place where RTU requests are framed, used by both
+    :func:`_embedPayload` and :meth:`Instrument._readSingleRegisterFast`.
+
+    """
+    return firstPart + _calculateCrcString(firstPart)
+
+
+def _frameAscii(firstPart):
+    """Build an ASCII mode message from the subordinateaddress + functioncode + payloaddata string.
+
+    Args:
+        firstPart (bytes): The byte string that the LRC is calculated from.
+
+    Returns:
+        The header (:), the hex encoded firstPart and LRC, and the footer (CRLF).
+
+    The data and the LRC are hex encoded in a single :func:`binascii.hexlify` call.
+
+    """
+    return _ASCII_HEADER + binascii.hexlify(firstPart + _calculateLrcString(firstPart)).upper() + _ASCII_FOOTER
+
+
 def _extractPayload(response, subordinateaddress, mode, functioncode):
     """Extract the payload data part from the subordinate's response.
 
     Args:
-        * response (str): The raw response byte string from the subordinate.
+        * response (bytes): The raw response byte string from the subordinate.
         * subordinateaddress (int): The adress of the subordinate. Used here for error checking only.
         * mode (str): The modbus protcol mode (rtu or ascii)
         * functioncode (int): Used here for error checking only.
 
     Returns:
-        The payload part of the *response* string.
+        The payload part of the *response* (bytes).
 
     Raises:
         ValueError, TypeError. Raises an exception if there is any problem with the received address, the functioncode or the CRC.
@@ -940,7 +1340,7 @@ def _extractPayload(response, subordinateaddress, mode, functioncode):
     For development purposes, this function can also be used to extract the payload from the message sent TO the subordinate.
 
     """
-    BYTEPOSITION_FOR_ASCII_HEADER          = 0  # Relative to plain response
+    BYTERANGE_FOR_ASCII_HEADER             = slice(0, 1)  # Relative to plain response
 
     BYTEPOSITION_FOR_SLAVEADDRESS          = 0  # Relative to (stripped) response
     BYTEPOSITION_FOR_FUNCTIONCODE          = 1
@@ -954,7 +1354,7 @@ def _extractPayload(response, subordinateaddress, mode, functioncode):
     MINIMAL_RESPONSE_LENGTH_ASCII          = 9
 
     # Argument validity testing
-    _checkString(response, description='response')
+    _checkBytes(response, description='response')
     _checkSubordinateaddress(subordinateaddress)
     _checkMode(mode)
     _checkFunctioncode(functioncode, None)
@@ -974,7 +1374,7 @@ def _extractPayload(response, subordinateaddress, mode, functioncode):
 
     # Validate the ASCII header and footer.
     if mode == MODE_ASCII:
-        if response[BYTEPOSITION_FOR_ASCII_HEADER] != _ASCII_HEADER:
+        if response[BYTERANGE_FOR_ASCII_HEADER] != _ASCII_HEADER:
             raise ValueError('Did not find header ({!r}) as start of ASCII response. The plain response is: {!r}'.format( \
                 _ASCII_HEADER,
                 response))
@@ -1016,16 +1416,16 @@ def _extractPayload(response, subordinateaddress, mode, functioncode):
         raise ValueError(text)
 
     # Check subordinate address
-    responseaddress = ord(response[BYTEPOSITION_FOR_SLAVEADDRESS])
+    responseaddress = response[BYTEPOSITION_FOR_SLAVEADDRESS]
 
     if responseaddress != subordinateaddress:
         raise ValueError('Wrong return subordinate address: {} instead of {}. The response is: {!r}'.format( \
             responseaddress, subordinateaddress, response))
 
     # Check function code
-    receivedFunctioncode = ord(response[BYTEPOSITION_FOR_FUNCTIONCODE])
+    receivedFunctioncode = response[BYTEPOSITION_FOR_FUNCTIONCODE]
 
-    if receivedFunctioncode == _setBitOn(functioncode, BITNUMBER_FUNCTIONCODE_ERRORINDICATION):
+    if receivedFunctioncode == functioncode | (1 << BITNUMBER_FUNCTIONCODE_ERRORINDICATION):
         raise ValueError('The subordinate is indicating an error. The response is: {!r}'.format(response))
 
     elif receivedFunctioncode != functioncode:
@@ -1054,7 +1454,7 @@ def _predictResponseSize(mode, functioncode, payloadToSubordinate):
     Args:
      * mode (str) :
      * functioncode (int):
-     * payloadToSubordinate (str): The raw message that is to be sent to the subordinate (not hex encoded string)
+     * payloadToSubordinate (bytes): The raw message that is to be sent to the subordinate (not hex encoded string)
 
     Returns:
         The preducted number of bytes (int) in the response.
@@ -1079,7 +1479,7 @@ def _predictResponseSize(mode, functioncode, payloadToSubordinate):
     # Argument validity testing
     _checkMode(mode)
     _checkFunctioncode(functioncode, None)
-    _checkString(payloadToSubordinate, description='payload', minlength=MIN_PAYLOAD_LENGTH)
+    _checkBytes(payloadToSubordinate, description='payload', minlength=MIN_PAYLOAD_LENGTH)
 
     # Calculate payload size
     if functioncode in [5, 6, 15, 16]:
@@ -1146,7 +1546,7 @@ def _numToOneByteString(inputvalue):
         inputvalue (int): The value to be converted. Should be >=0 and <=255.
 
     Returns:
-        A one-byte string created by chr(inputvalue).
+        A one-byte bytes object.
 
     Raises:
         TypeError, ValueError
@@ -1154,7 +1554,7 @@ def _numToOneByteString(inputvalue):
     """
     _checkInt(inputvalue, minvalue=0, maxvalue=0xFF)
 
-    return chr(inputvalue)
+    return bytes((inputvalue,))
 
 
 def _numToTwoByteString(value, numberOfDecimals=0, LsbFirst=False, signed=False):
@@ -1205,15 +1605,11 @@ def _numToTwoByteString(value, numberOfDecimals=0, LsbFirst=False, signed=False)
     integer = int(float(value) * multiplier)
 
     if LsbFirst:
-        formatcode = '<'  # Little-endian
+        structure = _S16_LE if signed else _U16_LE  # Little-endian
     else:
-        formatcode = '>'  # Big-endian
-    if signed:
-        formatcode += 'h'  # (Signed) short (2 bytes)
-    else:
-        formatcode += 'H'  # Unsigned short (2 bytes)
+        structure = _S16_BE if signed else _U16_BE  # Big-endian
 
-    outstring = _pack(formatcode, integer)
+    outstring = _pack(structure, integer)
     assert len(outstring) == 2
     return outstring
 
@@ -1221,7 +1617,7 @@ def _twoByteStringToNum(bytestring, numberOfDecimals=0, signed=False):
     """Convert a two-byte string to a numerical value, possibly scaling it.
 
     Args:
-        * bytestring (str): A string of length 2.
+        * bytestring (bytes): A string of length 2.
         * numberOfDecimals (int): The number of decimals. Defaults to 0.
         * signed (bol): Whether large positive values should be interpreted as negative values.
 
@@ -1245,17 +1641,11 @@ def _twoByteStringToNum(bytestring, numberOfDecimals=0, signed=False):
         ``numberOfDecimals = 1``, then this is converted to 77.0 (float).
 
     """
-    _checkString(bytestring, minlength=2, maxlength=2, description='bytestring')
+    _checkBytes(bytestring, minlength=2, maxlength=2, description='bytestring')
     _checkInt(numberOfDecimals, minvalue=0, description='number of decimals')
     _checkBool(signed, description='signed parameter')
 
-    formatcode = '>'  # Big-endian
-    if signed:
-        formatcode += 'h'  # (Signed) short (2 bytes)
-    else:
-        formatcode += 'H'  # Unsigned short (2 bytes)
-
-    fullregister = _unpack(formatcode, bytestring)
+    fullregister = _unpack(_S16_BE if signed else _U16_BE, bytestring)
 
     if numberOfDecimals == 0:
         return fullregister
@@ -1284,13 +1674,7 @@ def _longToBytestring(value, signed=False, numberOfRegisters=2):
     _checkBool(signed, description='signed parameter')
     _checkInt(numberOfRegisters, minvalue=2, maxvalue=2, description='number of registers')
 
-    formatcode = '>'  # Big-endian
-    if signed:
-        formatcode += 'l'  # (Signed) long (4 bytes)
-    else:
-        formatcode += 'L'  # Unsigned long (4 bytes)
-
-    outstring = _pack(formatcode, value)
+    outstring = _pack(_S32_BE if signed else _U32_BE, value)
     assert len(outstring) == 4
     return outstring
 
@@ -1301,7 +1685,7 @@ def _bytestringToLong(bytestring, signed=False, numberOfRegisters=2):
     Long integers (32 bits = 4 bytes) are stored in two consecutive 16-bit registers in the subordinate.
 
     Args:
-        * bytestring (str): A string of length 4.
+        * bytestring (bytes): A string of length 4.
         * signed (bol): Whether large positive values should be interpreted as negative values.
         * numberOfRegisters (int): Should be 2. For error checking only.
 
@@ -1312,17 +1696,11 @@ def _bytestringToLong(bytestring, signed=False, numberOfRegisters=2):
         ValueError, TypeError
 
     """
-    _checkString(bytestring, 'byte string', minlength=4, maxlength=4)
+    _checkBytes(bytestring, 'byte string', minlength=4, maxlength=4)
     _checkBool(signed, description='signed parameter')
     _checkInt(numberOfRegisters, minvalue=2, maxvalue=2, description='number of registers')
 
-    formatcode = '>'  # Big-endian
-    if signed:
-        formatcode += 'l'  # (Signed) long (4 bytes)
-    else:
-        formatcode += 'L'  # Unsigned long (4 bytes)
-
-    return _unpack(formatcode, bytestring)
+    return _unpack(_S32_BE if signed else _U32_BE, bytestring)
 
 
 def _floatToBytestring(value, numberOfRegisters=2):
@@ -1355,17 +1733,16 @@ def _floatToBytestring(value, numberOfRegisters=2):
     _checkNumerical(value, description='inputvalue')
     _checkInt(numberOfRegisters, minvalue=2, maxvalue=4, description='number of registers')
 
-    formatcode = '>'  # Big-endian
     if numberOfRegisters == 2:
-        formatcode += 'f'  # Float (4 bytes)
+        structure = _F32_BE
         lengthtarget = 4
     elif numberOfRegisters == 4:
-        formatcode += 'd'  # Double (8 bytes)
+        structure = _F64_BE
         lengthtarget = 8
     else:
         raise ValueError('Wrong number of registers! Given value is {0!r}'.format(numberOfRegisters))
 
-    outstring = _pack(formatcode, value)
+    outstring = _pack(structure, value)
     assert len(outstring) == lengthtarget
     return outstring
 
@@ -1379,7 +1756,7 @@ def _bytestringToFloat(bytestring, numberOfRegisters=2):
     and on alternative names, see :func:`minimalmodbus._floatToBytestring`.
 
     Args:
-        * bytestring (str): A string of length 4 or 8.
+        * bytestring (bytes): A string of length 4 or 8.
         * numberOfRegisters (int): Can be 2 or 4.
 
     Returns:
@@ -1389,16 +1766,15 @@ def _bytestringToFloat(bytestring, numberOfRegisters=2):
         TypeError, ValueError
 
     """
-    _checkString(bytestring, minlength=4, maxlength=8, description='bytestring')
+    _checkBytes(bytestring, minlength=4, maxlength=8, description='bytestring')
     _checkInt(numberOfRegisters, minvalue=2, maxvalue=4, description='number of registers')
 
     numberOfBytes = _NUMBER_OF_BYTES_PER_REGISTER * numberOfRegisters
 
-    formatcode = '>'  # Big-endian
     if numberOfRegisters == 2:
-        formatcode += 'f'  # Float (4 bytes)
+        structure = _F32_BE
     elif numberOfRegisters == 4:
-        formatcode += 'd'  # Double (8 bytes)
+        structure = _F64_BE
     else:
         raise ValueError('Wrong number of registers! Given value is {0!r}'.format(numberOfRegisters))
 
@@ -1406,7 +1782,7 @@ def _bytestringToFloat(bytestring, numberOfRegisters=2):
         raise ValueError('Wrong length of the byte string! Given value is {0!r}, and numberOfRegisters is {1!r}.'.\
             format(bytestring, numberOfRegisters))
 
-    return _unpack(formatcode, bytestring)
+    return _unpack(structure, bytestring)
 
 
 def _textstringToBytestring(inputstring, numberOfRegisters=16):
@@ -1415,7 +1791,7 @@ def _textstringToBytestring(inputstring, numberOfRegisters=16):
     Each 16-bit register in the subordinate are interpreted as two characters (1 byte = 8 bits).
     For example 16 consecutive registers can hold 32 characters (32 bytes).
 
-    Not much of conversion is done, mostly error checking and string padding.
+    The text is encoded as latin-1, one byte per character.
     If the inputstring is shorter that the allocated space, it is padded with spaces in the end.
 
     Args:
@@ -1423,7 +1799,7 @@ def _textstringToBytestring(inputstring, numberOfRegisters=16):
         * numberOfRegisters (int): The number of registers allocated for the string.
 
     Returns:
-        A bytestring (str).
+        A bytestring (bytes).
 
     Raises:
         TypeError, ValueError
@@ -1433,9 +1809,10 @@ def _textstringToBytestring(inputstring, numberOfRegisters=16):
     maxCharacters = _NUMBER_OF_BYTES_PER_REGISTER * numberOfRegisters
     _checkString(inputstring, 'input string', minlength=1, maxlength=maxCharacters)
 
-    bytestring = inputstring.ljust(maxCharacters)  # Pad with space
-    assert len(bytestring) == maxCharacters
-    return bytestring
+    try:
+        return inputstring.encode('latin1').ljust(maxCharacters)  # Pad with space
+    except UnicodeEncodeError:
+        raise ValueError('The input string can only hold latin-1 characters. Given: {0!r}'.format(inputstring))
 
 
 def _bytestringToTextstring(bytestring, numberOfRegisters=16):
@@ -1444,10 +1821,10 @@ def _bytestringToTextstring(bytestring, numberOfRegisters=16):
     Each 16-bit register in the subordinate are interpreted as two characters (1 byte = 8 bits).
     For example 16 consecutive registers can hold 32 characters (32 bytes).
 
-    Not much of conversion is done, mostly error checking.
+    The bytes are decoded as latin-1, one character per byte.
 
     Args:
-        * bytestring (str): The string from the subordinate. Length = 2*numberOfRegisters
+        * bytestring (bytes): The string from the subordinate. Length = 2*numberOfRegisters
         * numberOfRegisters (int): The number of registers allocated for the string.
 
     Returns:
@@ -1459,10 +1836,29 @@ def _bytestringToTextstring(bytestring, numberOfRegisters=16):
     """
     _checkInt(numberOfRegisters, minvalue=1, description='number of registers')
     maxCharacters = _NUMBER_OF_BYTES_PER_REGISTER * numberOfRegisters
-    _checkString(bytestring, 'byte string', minlength=maxCharacters, maxlength=maxCharacters)
+    _checkBytes(bytestring, 'byte string', minlength=maxCharacters, maxlength=maxCharacters)
+
+    return bytestring.decode('latin1')
+
+
+def _registerArrayStruct(numberOfRegisters):
+    """Give a precompiled struct format for an array of 'unsigned INT16' registers.
+
+    The :class:`struct.Struct` object is created once per number of registers,
+    and stored in :data:`_REGISTER_ARRAY_STRUCTS`.
 
-    textstring = bytestring
-    return textstring
+    Args:
+        numberOfRegisters (int): The number of registers.
+
+    Returns:
+        A :class:`struct.Struct` object.
+
+    """
+    structure = _REGISTER_ARRAY_STRUCTS.get(numberOfRegisters)
+    if structure is None:
+        structure = _REGISTER_ARRAY_STRUCTS.setdefault(numberOfRegisters, \
+            struct.Struct('>{0}H'.format(numberOfRegisters)))
+    return structure
 
 
 def _valuelistToBytestring(valuelist, numberOfRegisters):
@@ -1475,7 +1871,7 @@ def _valuelistToBytestring(valuelist, numberOfRegisters):
         * numberOfRegisters (int): The number of registers. For error checking.
 
     Returns:
-        A bytestring (str). Length = 2*numberOfRegisters
+        A bytestring (bytes). Length = 2*numberOfRegisters
 
     Raises:
         TypeError, ValueError
@@ -1489,20 +1885,22 @@ def _valuelistToBytestring(valuelist, numberOfRegisters):
     if not isinstance(valuelist, list):
         raise TypeError('The valuelist parameter must be a list. Given {0!r}.'.format(valuelist))
 
-    for value in valuelist:
-        _checkInt(value, minvalue=MINVALUE, maxvalue=MAXVALUE, description='elements in the input value list')
-
     _checkInt(len(valuelist), minvalue=numberOfRegisters, maxvalue=numberOfRegisters, \
         description='length of the list')
 
-    numberOfBytes = _NUMBER_OF_BYTES_PER_REGISTER * numberOfRegisters
-
-    bytestring = ''
+    # One pass for the exact type (struct.pack would also accept bool and objects with __index__),
+    # then all registers are packed in one call, which checks the range of each value.
     for value in valuelist:
-        bytestring += _numToTwoByteString(value, signed=False)
+        if type(value) is not int:
+            raise TypeError('The elements in the input value list must be integers. Given: {0!r}'.format(value))
 
-    assert len(bytestring) == numberOfBytes
-    return bytestring
+    try:
+        return _registerArrayStruct(numberOfRegisters).pack(*valuelist)
+    except struct.error:
+        pass
+
+    raise ValueError('The elements in the input value list must be in the range {0} to {1}. Given: {2!r}'.format( \
+        MINVALUE, MAXVALUE, valuelist))
 
 
 def _bytestringToValuelist(bytestring, numberOfRegisters):
@@ -1511,7 +1909,7 @@ def _bytestringToValuelist(bytestring, numberOfRegisters):
     The bytestring is interpreted as 'unsigned INT16'.
 
     Args:
-        * bytestring (str): The string from the subordinate. Length = 2*numberOfRegisters
+        * bytestring (bytes): The string from the subordinate. Length = 2*numberOfRegisters
         * numberOfRegisters (int): The number of registers. For error checking.
 
     Returns:
@@ -1523,81 +1921,61 @@ def _bytestringToValuelist(bytestring, numberOfRegisters):
     """
     _checkInt(numberOfRegisters, minvalue=1, description='number of registers')
     numberOfBytes = _NUMBER_OF_BYTES_PER_REGISTER * numberOfRegisters
-    _checkString(bytestring, 'byte string', minlength=numberOfBytes, maxlength=numberOfBytes)
-
-    values = []
-    for i in range(numberOfRegisters):
-        offset = _NUMBER_OF_BYTES_PER_REGISTER * i
-        substring = bytestring[offset : offset + _NUMBER_OF_BYTES_PER_REGISTER]
-        values.append(_twoByteStringToNum(substring))
+    _checkBytes(bytestring, 'byte string', minlength=numberOfBytes, maxlength=numberOfBytes)
 
-    return values
+    return list(_registerArrayStruct(numberOfRegisters).unpack(bytestring))
 
 
-def _pack(formatstring, value):
+def _pack(structure, value):
     """Pack a value into a bytestring.
 
     Uses the built-in :mod:`struct` Python module.
 
     Args:
-        * formatstring (str): String for the packing. See the :mod:`struct` module for details.
-        * value (depends on formatstring): The value to be packed
+        * structure (struct.Struct): Precompiled format for the packing, for example :data:`_U16_BE`.
+        * value (depends on the format): The value to be packed
 
     Returns:
-        A bytestring (str).
+        A bytestring (bytes).
 
     Raises:
         ValueError
 
-    Note that the :mod:`struct` module produces byte buffers for Python3,
-    but bytestrings for Python2. This is compensated for automatically.
-
     """
-    _checkString(formatstring, description='formatstring', minlength=1)
-
     try:
-        result = struct.pack(formatstring, value)
+        result = structure.pack(value)
     except:
         errortext = 'The value to send is probably out of range, as the num-to-bytestring conversion failed.'
         errortext += ' Value: {0!r} Struct format code is: {1}'
-        raise ValueError(errortext.format(value, formatstring))
+        raise ValueError(errortext.format(value, structure.format))
 
-    if sys.version_info[0] > 2:
-        return str(result, encoding='latin1')  # Convert types to make it Python3 compatible
     return result
 
 
-def _unpack(formatstring, packed):
+def _unpack(structure, packed):
     """Unpack a bytestring into a value.
 
     Uses the built-in :mod:`struct` Python module.
 
     Args:
-        * formatstring (str): String for the packing. See the :mod:`struct` module for details.
-        * packed (str): The bytestring to be unpacked.
+        * structure (struct.Struct): Precompiled format for the unpacking, for example :data:`_U16_BE`.
+        * packed (bytes): The bytestring to be unpacked.
 
     Returns:
-        A value. The type depends on the formatstring.
+        A value. The type depends on the format.
 
     Raises:
         ValueError
 
-    Note that the :mod:`struct` module wants byte buffers for Python3,
-    but bytestrings for Python2. This is compensated for automatically.
-
     """
-    _checkString(formatstring, description='formatstring', minlength=1)
-    _checkString(packed, description='packed string', minlength=1)
-
-    if sys.version_info[0] > 2:
-        packed = bytes(packed, encoding='latin1')  # Convert types to make it Python3 compatible
+    _checkBytes(packed, description='packed string', minlength=1)
 
     try:
-        value = struct.unpack(formatstring, packed)[0]
+        value = structure.unpack(packed)[0]
     except:
         errortext = 'The received bytestring is probably wrong, as the bytestring-to-num conversion failed.'
         errortext += ' Bytestring: {0!r} Struct format code is: {1}'
-        raise ValueError(errortext.format(packed, formatstring))
+        raise ValueError(errortext.format(packed, structure.format))
 
     return value
 
@@ -1605,75 +1983,56 @@ def _unpack(formatstring, packed):
 def _hexencode(bytestring):
     """Convert a byte string to a hex encoded string.
 
-    For example 'J' will return '4A', and ``'\\x04'`` will return '04'.
+    For example b'J' will return b'4A', and ``b'\\x04'`` will return b'04'.
 
     Args:
-        bytestring (str): Can be for example ``'A\\x01B\\x45'``.
+        bytestring (bytes): Can be for example ``b'A\\x01B\\x45'``.
 
     Returns:
-        A string of twice the length, with characters in the range '0' to '9' and 'A' to 'F'.
+        Bytes of twice the length, with characters in the range '0' to '9' and 'A' to 'F'.
 
     Raises:
         TypeError, ValueError
 
     """
-    _checkString(bytestring, description='byte string')
+    _checkBytes(bytestring, description='byte string')
 
-    # Use plain string formatting instead of binhex.hexlify,
-    # in order to have it Python 2.x and 3.x compatible
-
-    outstring = ''
-    for c in bytestring:
-        outstring += '{0:02X}'.format(ord(c))
-    return outstring
+    return binascii.hexlify(bytestring).upper()
 
 
 def _hexdecode(hexstring):
     """Convert a hex encoded string to a byte string.
 
-    For example '4A' will return 'J', and '04' will return ``'\\x04'`` (which has length 1).
+    For example b'4A' will return b'J', and b'04' will return ``b'\\x04'`` (which has length 1).
 
     Args:
-        hexstring (str): Can be for example 'A3'. Must be of even length.
+        hexstring (bytes): Can be for example b'A3'. Must be of even length.
         Allowed characters are '0' to '9', 'a' to 'f' and 'A' to 'F'.
 
     Returns:
-        A string of half the length, with characters corresponding to all 0-255 values for each byte.
+        Bytes of half the length, with all 0-255 values for each byte.
 
     Raises:
         TypeError, ValueError
 
     """
-    # Note: For Python3 the appropriate would be: raise TypeError(new_error_message) from err
-    # but the Python2 interpreter will indicate SyntaxError.
-    # Thus we need to live with this warning in Python3:
-    # 'During handling of the above exception, another exception occurred'
-
-    _checkString(hexstring, description='hexstring')
+    _checkBytes(hexstring, description='hexstring')
 
-    if len(hexstring) % 2 != 0:
+    if len(hexstring) & 1:
         raise ValueError('The input hexstring must be of even length. Given: {!r}'.format(hexstring))
 
-    if sys.version_info[0] > 2:
-        by = bytes(hexstring, 'latin1')
-        try:
-            return str(binascii.unhexlify(by), encoding='latin1')
-        except binascii.Error as err:
-            new_error_message = 'Hexdecode reported an error: {!s}. Input hexstring: {}'.format(err.args[0], hexstring)
-            raise TypeError(new_error_message)
-
-    else:
-        try:
-            return hexstring.decode('hex')
-        except TypeError as err:
-            raise TypeError('Hexdecode reported an error: {}. Input hexstring: {}'.format(err.message, hexstring))
+    try:
+        return binascii.unhexlify(hexstring)
+    except binascii.Error as err:
+        new_error_message = 'Hexdecode reported an error: {!s}. Input hexstring: {}'.format(err.args[0], hexstring)
+        raise TypeError(new_error_message) from err
 
 
 def _bitResponseToValue(bytestring):
     """Convert a response string to a numerical value.
 
     Args:
-        bytestring (str): A string of length 1. Can be for example ``\\x01``.
+        bytestring (bytes): A bytestring of length 1. Can be for example ``b'\\x01'``.
 
     Returns:
         The converted value (int).
@@ -1682,17 +2041,12 @@ def _bitResponseToValue(bytestring):
         TypeError, ValueError
 
     """
-    _checkString(bytestring, description='bytestring', minlength=1, maxlength=1)
+    _checkBytes(bytestring, description='bytestring', minlength=1, maxlength=1)
 
-    RESPONSE_ON  = '\x01'
-    RESPONSE_OFF = '\x00'
-
-    if bytestring == RESPONSE_ON:
-        return 1
-    elif bytestring == RESPONSE_OFF:
-        return 0
-    else:
+    value = bytestring[0]  # The response byte is 0x00 (off) or 0x01 (on), so it is already the value
+    if value > 1:
         raise ValueError('Could not convert bit response to a value. Input: {0!r}'.format(bytestring))
+    return value
 
 
 def _createBitpattern(functioncode, value):
@@ -1705,7 +2059,7 @@ def _createBitpattern(functioncode, value):
         * value (int): can be 0 or 1
 
     Returns:
-        The bit pattern (string).
+        The bit pattern (bytes).
 
     Raises:
         TypeError, ValueError
@@ -1716,15 +2070,23 @@ def _createBitpattern(functioncode, value):
 
     if functioncode == 5:
         if value == 0:
-            return '\x00\x00'
+            return b'\x00\x00'
         else:
-            return '\xff\x00'
+            return b'\xff\x00'
 
     elif functioncode == 15:
         if value == 0:
-            return '\x00'
+            return b'\x00'
         else:
-            return '\x01'  # Is this correct??
+            return b'\x01'  # Is this correct??
+
+_BITPATTERN_CACHE = {
+    (5, 0): b'\x00\x00',
+    (5, 1): b'\xff\x00',
+    (15, 0): b'\x00',
+    (15, 1): b'\x01',
+}
+"""The bit patterns from :func:`_createBitpattern`, by (functioncode, value)."""
 
 #######################
 # Number manipulation #
@@ -1760,16 +2122,15 @@ def _twosComplement(x, bits=16):
     """
     _checkInt(bits, minvalue=0, description='number of bits')
     _checkInt(x, description='input')
-    upperlimit = 2 ** (bits - 1) - 1
-    lowerlimit = -2 ** (bits - 1)
+    signbit = 1 << (bits - 1)
+    upperlimit = signbit - 1
+    lowerlimit = -signbit
     if x > upperlimit or x < lowerlimit:
         raise ValueError('The input value is out of range. Given value is {0}, but allowed range is {1} to {2} when using {3} bits.' \
             .format(x, lowerlimit, upperlimit, bits))
 
-    # Calculate two'2 complement
-    if x >= 0:
-        return x
-    return x + 2 ** bits
+    # Calculate two's complement. Masking leaves non-negative values unchanged, and adds 2**bits to negative values
+    return x & ((1 << bits) - 1)
 
 
 def _fromTwosComplement(x, bits=16):
@@ -1799,117 +2160,79 @@ def _fromTwosComplement(x, bits=16):
     _checkInt(bits, minvalue=0, description='number of bits')
 
     _checkInt(x, description='input')
-    upperlimit = 2 ** (bits) - 1
+    upperlimit = (1 << bits) - 1
     lowerlimit = 0
     if x > upperlimit or x < lowerlimit:
         raise ValueError('The input value is out of range. Given value is {0}, but allowed range is {1} to {2} when using {3} bits.' \
             .format(x, lowerlimit, upperlimit, bits))
 
-    # Calculate inverse(?) of two'2 complement
-    limit = 2 ** (bits - 1) - 1
-    if x <= limit:
-        return x
-    return x - 2 ** bits
-
-####################
-# Bit manipulation #
-####################
-
-
-def _XOR(integer1, integer2):
-    """An alias for the bitwise XOR command.
-
-    Args:
-        * integer1 (int): Input integer
-        * integer2 (int): Input integer
-
-    Returns:
-        The XOR:ed value of the two input integers. This is an integer.
-    """
-    _checkInt(integer1, minvalue=0, description='integer1')
-    _checkInt(integer2, minvalue=0, description='integer2')
-
-    return integer1 ^ integer2
+    # Calculate inverse(?) of two's complement. The sign bit counts as -2**(bits-1) instead of +2**(bits-1)
+    signbit = 1 << (bits - 1)
+    return (x & (signbit - 1)) - (x & signbit)
 
+############################
+# Error checking functions #
+############################
 
-def _setBitOn(x, bitNum):
-    """Set bit 'bitNum' to True.
 
-    Args:
-        * x (int): The value before.
-        * bitNum (int): The bit number that should be set to True.
+def _createCrcTable():
+    """Precalculate the CRC-16 register update for each of the 256 byte values.
 
     Returns:
-        The value after setting the bit. This is an integer.
+        An array of 256 unsigned 16-bit integers.
 
-    For example:
-        For x = 4 (dec) = 0100 (bin), setting bit number 0 results in 0101 (bin) = 5 (dec).
+    Algorithm from the document 'MODBUS over serial line specification and implementation guide V1.02'.
 
     """
-    _checkInt(x, minvalue=0, description='input value')
-    _checkInt(bitNum, minvalue=0, description='bitnumber')
-
-    return x | (1 << bitNum)
-
-
-def _rightshift(inputInteger):
-    """Rightshift an integer one step, and also calculate the carry bit.
-
-    Args:
-        inputInteger (int): The value to be rightshifted. Should be positive.
+    # Constant for MODBUS CRC-16
+    POLY = 0xA001
 
-    Returns:
-        The tuple (*shifted*, *carrybit*) where *shifted* is the rightshifted integer and *carrybit* is the
-        resulting carry bit.
+    table = array('H')
+    for byte in range(256):
+        register = byte
 
-    For example:
-        An *inputInteger* = 9 (dec) = 1001 (bin) will after a rightshift be 0100 (bin) = 4 and the carry bit is 1.
-        The return value will then be the tuple (4, 1).
-
-    """
-    _checkInt(inputInteger, minvalue=0)
+        # Rightshift 8 times, and XOR with polynom if carry overflows
+        for i in range(8):
+            carrybit = register & 1
+            register >>= 1
+            if carrybit:
+                register ^= POLY
 
-    shifted = inputInteger >> 1
-    carrybit = inputInteger & 1
-    return shifted, carrybit
+        table.append(register)
+    return table
 
-############################
-# Error checking functions #
-############################
+_CRC16_MODBUS_TABLE = _createCrcTable()
 
 
 def _calculateCrcString(inputstring):
     """Calculate CRC-16 for Modbus.
 
     Args:
-        inputstring (str): An arbitrary-length message (without the CRC).
+        inputstring (bytes): An arbitrary-length message (without the CRC).
 
     Returns:
         A two-byte CRC string, where the least significant byte is first.
 
-    Algorithm from the document 'MODBUS over serial line specification and implementation guide V1.02'.
+    Table driven, one lookup per byte, using :data:`_CRC16_MODBUS_TABLE`.
+    Iterating over the bytes gives integers directly, without calling :func:`ord` per character.
+
+    If the optional :mod:`fastcrc` package is installed, its C implementation is used instead.
 
     """
-    _checkString(inputstring, description='input CRC string')
+    _checkBytes(inputstring, description='input CRC string')
 
-    # Constant for MODBUS CRC-16
-    POLY = 0xA001
+    if _fastcrc16 is not None:
+        return _U16_LE.pack(_fastcrc16.modbus(inputstring))
+
+    table = _CRC16_MODBUS_TABLE
 
     # Preload a 16-bit register with ones
     register = 0xFFFF
 
-    for character in inputstring:
-
-        # XOR with each character
-        register = _XOR(register, ord(character))
+    for byte in inputstring:
+        register = (register >> 8) ^ table[(register ^ byte) & 0xFF]
 
-        # Rightshift 8 times, and XOR with polynom if carry overflows
-        for i in range(8):
-            register, carrybit = _rightshift(register)
-            if carrybit == 1:
-                register = _XOR(register, POLY)
-
-    return _numToTwoByteString(register, LsbFirst=True)
+    return _U16_LE.pack(register)  # Always within 16 bits, so no range checking is needed
 
     # stringConverted = f"{register:0>4x}"
     # firstStr = r"\x" + stringConverted[:2]
@@ -1921,7 +2244,7 @@ def _calculateLrcString(inputstring):
     """Calculate LRC for Modbus.
 
     Args:
-        inputstring (str): An arbitrary-length message (without the beginning
+        inputstring (bytes): An arbitrary-length message (without the beginning
         colon and terminating CRLF). It should already be decoded from hex-string.
 
     Returns:
@@ -1938,16 +2261,11 @@ def _calculateLrcString(inputstring):
     example should be transmitted '61', which is a string of length two. This function
     does not handle that conversion for transmission.
     """
-    _checkString(inputstring, description='input LRC string')
-
-    register = 0
-    for character in inputstring:
-        register += ord(character)
+    _checkBytes(inputstring, description='input LRC string')
 
-    lrc = ((register ^ 0xFF) + 1) & 0xFF
+    lrc = -sum(inputstring) & 0xFF  # Two's complement of the byte sum, same as ((sum ^ 0xFF) + 1) & 0xFF
 
-    lrcString = _numToOneByteString(lrc)
-    return lrcString
+    return bytes((lrc,))
 
 
 def _checkMode(mode):
@@ -1960,7 +2278,6 @@ def _checkMode(mode):
         TypeError, ValueError
 
     """
-
     if not isinstance(mode, str):
         raise TypeError('The {0} should be a string. Given: {1!r}'.format("mode", mode))
 
@@ -1981,6 +2298,12 @@ def _checkFunctioncode(functioncode, listOfAllowedValues=[]):
         TypeError, ValueError
 
     """
+    if not _VALIDATE:
+        # Unsupported function codes must still be rejected here, the callers look them up in tables
+        if listOfAllowedValues is not None and functioncode not in listOfAllowedValues:
+            raise ValueError('Wrong function code: {0}, allowed values are {1!r}'.format(functioncode, listOfAllowedValues))
+        return
+
     FUNCTIONCODE_MIN = 1
     FUNCTIONCODE_MAX = 127
 
@@ -2012,7 +2335,13 @@ def _checkSubordinateaddress(subordinateaddress):
     SLAVEADDRESS_MAX = 247
     SLAVEADDRESS_MIN = 0
 
-    _checkInt(subordinateaddress, SLAVEADDRESS_MIN, SLAVEADDRESS_MAX, description='subordinateaddress')
+    # Always checked, also when _VALIDATE is False: the address goes straight into the request frame
+    if type(subordinateaddress) is int and SLAVEADDRESS_MIN <= subordinateaddress <= SLAVEADDRESS_MAX:
+        return
+    if not isinstance(subordinateaddress, int):
+        raise TypeError('The subordinateaddress must be an integer. Given: {0!r}'.format(subordinateaddress))
+    raise ValueError('The subordinateaddress is out of range: {0}, allowed values are {1} to {2}.'.format( \
+        subordinateaddress, SLAVEADDRESS_MIN, SLAVEADDRESS_MAX))
 
 
 def _checkRegisteraddress(registeraddress):
@@ -2028,7 +2357,13 @@ def _checkRegisteraddress(registeraddress):
     REGISTERADDRESS_MAX = 0xFFFF
     REGISTERADDRESS_MIN = 0
 
-    _checkInt(registeraddress, REGISTERADDRESS_MIN, REGISTERADDRESS_MAX, description='registeraddress')
+    # Always checked, also when _VALIDATE is False: the address goes straight into the request frame
+    if type(registeraddress) is int and REGISTERADDRESS_MIN <= registeraddress <= REGISTERADDRESS_MAX:
+        return
+    if not isinstance(registeraddress, int):
+        raise TypeError('The registeraddress must be an integer. Given: {0!r}'.format(registeraddress))
+    raise ValueError('The registeraddress is out of range: {0}, allowed values are {1} to {2}.'.format( \
+        registeraddress, REGISTERADDRESS_MIN, REGISTERADDRESS_MAX))
 
 
 def _checkResponseByteCount(payload):
@@ -2037,7 +2372,7 @@ def _checkResponseByteCount(payload):
     The first byte in the payload indicates the length of the payload (first byte not counted).
 
     Args:
-        payload (string): The payload
+        payload (bytes): The payload
 
     Raises:
         TypeError, ValueError
@@ -2046,9 +2381,9 @@ def _checkResponseByteCount(payload):
     POSITION_FOR_GIVEN_NUMBER = 0
     NUMBER_OF_BYTES_TO_SKIP = 1
 
-    _checkString(payload, minlength=1, description='payload')
+    _checkBytes(payload, minlength=1, description='payload')
 
-    givenNumberOfDatabytes = ord(payload[POSITION_FOR_GIVEN_NUMBER])
+    givenNumberOfDatabytes = payload[POSITION_FOR_GIVEN_NUMBER]
     countedNumberOfDatabytes = len(payload) - NUMBER_OF_BYTES_TO_SKIP
 
     if givenNumberOfDatabytes != countedNumberOfDatabytes:
@@ -2058,81 +2393,94 @@ def _checkResponseByteCount(payload):
         raise ValueError(errortext)
 
 
-def _checkResponseRegisterAddress(payload, registeraddress):
+def _parseWriteResponseHeader(payload):
+    """Parse the header of a response to a write command (function code 5, 6, 15 or 16).
+
+    The bytes 0 and 1 (zero based counting) in the payload holds the register address, and the
+    bytes 2 and 3 holds the write data or the number of written registers.
+
+    Args:
+        payload (bytes): The payload
+
+    Returns:
+        A tuple ``(registeraddress, value)`` of two ints.
+
+    Raises:
+        TypeError, ValueError
+
+    """
+    _checkBytes(payload, minlength=4, description='payload')
+
+    return _WRITE_RESPONSE_HEADER.unpack_from(payload)
+
+
+def _checkResponseRegisterAddress(payload, registeraddress, header=None):
     """Check that the start adress as given in the response is correct.
 
-    The first two bytes in the payload holds the address value.
+    Thin wrapper around :func:`_parseWriteResponseHeader`, kept for back-compatibility.
 
     Args:
-        * payload (string): The payload
+        * payload (bytes): The payload
         * registeraddress (int): The register address (use decimal numbers, not hex).
+        * header (tuple or None): The already parsed header, if available. Then the payload is not parsed again.
 
     Raises:
         TypeError, ValueError
 
     """
-    _checkString(payload, minlength=2, description='payload')
     _checkRegisteraddress(registeraddress)
+    if header is None:
+        header = _parseWriteResponseHeader(payload)
 
-    BYTERANGE_FOR_STARTADDRESS = slice(0, 2)
-
-    bytesForStartAddress = payload[BYTERANGE_FOR_STARTADDRESS]
-    receivedStartAddress = _twoByteStringToNum(bytesForStartAddress)
-
-    if receivedStartAddress != registeraddress:
+    if header[0] != registeraddress:
         raise ValueError('Wrong given write start adress: {0}, but commanded is {1}. The data payload is: {2!r}'.format( \
-            receivedStartAddress, registeraddress, payload))
+            header[0], registeraddress, payload))
 
 
-def _checkResponseNumberOfRegisters(payload, numberOfRegisters):
+def _checkResponseNumberOfRegisters(payload, numberOfRegisters, header=None):
     """Check that the number of written registers as given in the response is correct.
 
-    The bytes 2 and 3 (zero based counting) in the payload holds the value.
+    Thin wrapper around :func:`_parseWriteResponseHeader`, kept for back-compatibility.
 
     Args:
-        * payload (string): The payload
+        * payload (bytes): The payload
         * numberOfRegisters (int): Number of registers that have been written
+        * header (tuple or None): The already parsed header, if available. Then the payload is not parsed again.
 
     Raises:
         TypeError, ValueError
 
     """
-    _checkString(payload, minlength=4, description='payload')
     _checkInt(numberOfRegisters, minvalue=1, maxvalue=0xFFFF, description='numberOfRegisters')
+    if header is None:
+        header = _parseWriteResponseHeader(payload)
 
-    BYTERANGE_FOR_NUMBER_OF_REGISTERS = slice(2, 4)
-
-    bytesForNumberOfRegisters = payload[BYTERANGE_FOR_NUMBER_OF_REGISTERS]
-    receivedNumberOfWrittenReisters = _twoByteStringToNum(bytesForNumberOfRegisters)
-
-    if receivedNumberOfWrittenReisters != numberOfRegisters:
+    if header[1] != numberOfRegisters:
         raise ValueError('Wrong number of registers to write in the response: {0}, but commanded is {1}. The data payload is: {2!r}'.format( \
-            receivedNumberOfWrittenReisters, numberOfRegisters, payload))
+            header[1], numberOfRegisters, payload))
 
 
-def _checkResponseWriteData(payload, writedata):
+def _checkResponseWriteData(payload, writedata, header=None):
     """Check that the write data as given in the response is correct.
 
-    The bytes 2 and 3 (zero based counting) in the payload holds the write data.
+    Thin wrapper around :func:`_parseWriteResponseHeader`, kept for back-compatibility.
 
     Args:
-        * payload (string): The payload
-        * writedata (string): The data to write, length should be 2 bytes.
+        * payload (bytes): The payload
+        * writedata (bytes): The data to write, length should be 2 bytes.
+        * header (tuple or None): The already parsed header, if available. Then the payload is not parsed again.
 
     Raises:
         TypeError, ValueError
 
     """
-    _checkString(payload, minlength=4, description='payload')
-    _checkString(writedata, minlength=2, maxlength=2, description='writedata')
-
-    BYTERANGE_FOR_WRITEDATA = slice(2, 4)
-
-    receivedWritedata = payload[BYTERANGE_FOR_WRITEDATA]
+    _checkBytes(writedata, minlength=2, maxlength=2, description='writedata')
+    if header is None:
+        header = _parseWriteResponseHeader(payload)
 
-    if receivedWritedata != writedata:
+    if header[1] != _U16_BE.unpack(writedata)[0]:
         raise ValueError('Wrong write data in the response: {0!r}, but commanded is {1!r}. The data payload is: {2!r}'.format( \
-            receivedWritedata, writedata, payload))
+            _U16_BE.pack(header[1]), writedata, payload))
 
 
 def _checkString(inputstring, description, minlength=0, maxlength=None):
@@ -2150,6 +2498,9 @@ def _checkString(inputstring, description, minlength=0, maxlength=None):
     Uses the function :func:`_checkInt` internally.
 
     """
+    if not _VALIDATE:
+        return
+
     # Type checking
     if not isinstance(description, str):
         raise TypeError('The description should be a string. Given: {0!r}'.format(description))
@@ -2180,13 +2531,38 @@ def _checkString(inputstring, description, minlength=0, maxlength=None):
                 description, len(inputstring), maxlength, inputstring))
 
 
+def _checkBytes(inputbytes, description, minlength=0, maxlength=None):
+    """Check that the given bytestring is valid.
+
+    Args:
+        * inputbytes (bytes): The bytestring to be checked
+        * description (string): Used in error messages for the checked inputbytes
+        * minlength (int): Minimum length of the bytestring
+        * maxlength (int or None): Maximum length of the bytestring
+
+    Raises:
+        TypeError, ValueError
+
+    """
+    if not isinstance(inputbytes, (bytes, bytearray)):
+        raise TypeError('The {0} should be bytes. Given: {1!r}'.format(description, inputbytes))
+
+    if len(inputbytes) < minlength:
+        raise ValueError('The {0} is too short: {1}, but minimum value is {2}. Given: {3!r}'.format( \
+            description, len(inputbytes), minlength, inputbytes))
+
+    if maxlength is not None and len(inputbytes) > maxlength:
+        raise ValueError('The {0} is too long: {1}, but maximum value is {2}. Given: {3!r}'.format( \
+            description, len(inputbytes), maxlength, inputbytes))
+
+
 def _checkInt(inputvalue, minvalue=None, maxvalue=None, description='inputvalue'):
     """Check that the given integer is valid.
 
     Args:
-        * inputvalue (int or long): The integer to be checked
-        * minvalue (int or long, or None): Minimum value of the integer
-        * maxvalue (int or long, or None): Maximum value of the integer
+        * inputvalue (int): The integer to be checked
+        * minvalue (int or None): Minimum value of the integer
+        * maxvalue (int or None): Maximum value of the integer
         * description (string): Used in error messages for the checked inputvalue
 
     Raises:
@@ -2195,16 +2571,26 @@ def _checkInt(inputvalue, minvalue=None, maxvalue=None, description='inputvalue'
     Note: Can not use the function :func:`_checkString`, as that function uses this function internally.
 
     """
+    if not _VALIDATE:
+        return
+
+    # Fast path for the common case. Anything unusual falls through to the full checks, for the error messages.
+    if type(inputvalue) is int and (minvalue is None or type(minvalue) is int) and \
+            (maxvalue is None or type(maxvalue) is int) and type(description) is str:
+        if (minvalue is None or minvalue <= inputvalue) and (maxvalue is None or inputvalue <= maxvalue):
+            if minvalue is None or maxvalue is None or minvalue <= maxvalue:
+                return
+
     if not isinstance(description, str):
         raise TypeError('The description should be a string. Given: {0!r}'.format(description))
 
-    if not isinstance(inputvalue, (int, long)):
+    if not isinstance(inputvalue, int):
         raise TypeError('The {0} must be an integer. Given: {1!r}'.format(description, inputvalue))
 
-    if not isinstance(minvalue, (int, long, type(None))):
+    if not isinstance(minvalue, (int, type(None))):
         raise TypeError('The minvalue must be an integer or None. Given: {0!r}'.format(minvalue))
 
-    if not isinstance(maxvalue, (int, long, type(None))):
+    if not isinstance(maxvalue, (int, type(None))):
         raise TypeError('The maxvalue must be an integer or None. Given: {0!r}'.format(maxvalue))
 
     _checkNumerical(inputvalue, minvalue, maxvalue, description)
@@ -2225,17 +2611,27 @@ def _checkNumerical(inputvalue, minvalue=None, maxvalue=None, description='input
     Note: Can not use the function :func:`_checkString`, as it uses this function internally.
 
     """
+    if not _VALIDATE:
+        return
+
+    # Fast path for the common case. Anything unusual falls through to the full checks, for the error messages.
+    if type(inputvalue) in _NUMERICAL_TYPES and (minvalue is None or type(minvalue) in _NUMERICAL_TYPES) and \
+            (maxvalue is None or type(maxvalue) in _NUMERICAL_TYPES) and type(description) is str:
+        if (minvalue is None or minvalue <= inputvalue) and (maxvalue is None or inputvalue <= maxvalue):
+            if minvalue is None or maxvalue is None or minvalue <= maxvalue:
+                return
+
     # Type checking
     if not isinstance(description, str):
         raise TypeError('The description should be a string. Given: {0!r}'.format(description))
 
-    if not isinstance(inputvalue, (int, long, float)):
+    if not isinstance(inputvalue, (int, float)):
         raise TypeError('The {0} must be numerical. Given: {1!r}'.format(description, inputvalue))
 
-    if not isinstance(minvalue, (int, float, long, type(None))):
+    if not isinstance(minvalue, (int, float, type(None))):
         raise TypeError('The minvalue must be numeric or None. Given: {0!r}'.format(minvalue))
 
-    if not isinstance(maxvalue, (int, float, long, type(None))):
+    if not isinstance(maxvalue, (int, float, type(None))):
         raise TypeError('The maxvalue must be numeric or None. Given: {0!r}'.format(maxvalue))
 
     # Consistency checking
@@ -2267,6 +2663,9 @@ def _checkBool(inputvalue, description='inputvalue'):
         TypeError, ValueError
 
     """
+    if not _VALIDATE:
+        return
+
     _checkString(description, minlength=1, description='description string')
     if not isinstance(inputvalue, bool):
         raise TypeError('The {0} must be boolean. Given: {1!r}'.format(description, inputvalue))
@@ -2291,47 +2690,62 @@ def _print_out(inputstring):
     sys.stdout.write(inputstring + '\n')
 
 
+@functools.lru_cache(maxsize=1)
+def _getStaticDiagnosticLines():
+    """Generate the part of the diagnostic output that does not change while the process runs.
+
+    Built once, on the first call of :func:`_getDiagnosticString`.
+
+    Returns:
+        A tuple of lines (str).
+
+    """
+    return (
+        '## Diagnostic output from minimalmodbus ## ',
+        '',
+        'File name (with relative path): ' + __file__,
+        'Full file path: ' + os.path.abspath(__file__),
+        '',
+        'pySerial version: ' + serial.VERSION,
+        'pySerial full file path: ' + os.path.abspath(serial.__file__),
+        '',
+        'Platform: ' + sys.platform,
+        'Filesystem encoding: ' + repr(sys.getfilesystemencoding()),
+        'Byteorder: ' + sys.byteorder,
+        'Python version: ' + sys.version,
+        'Python version info: ' + repr(sys.version_info),
+        'Python flags: ' + repr(sys.flags),
+        'Python prefix: ' + repr(sys.prefix),
+        'Python exec prefix: ' + repr(sys.exec_prefix),
+        'Python executable: ' + repr(sys.executable),
+        'Int info: ' + repr(sys.int_info),
+        'Float repr style: ' + repr(sys.float_repr_style),
+        '',
+        'Variable __name__: ' + __name__,
+    )
+
+
 def _getDiagnosticString():
-    """Generate a diagnostic string, showing the module version, the platform, current directory etc.
+    """Generate a diagnostic string, showing the platform, current directory etc.
+
+    The static part is cached by :func:`_getStaticDiagnosticLines`. The arguments,
+    the current directory and the Python path are read on each call.
 
     Returns:
         A descriptive string.
 
     """
-    text = '\n## Diagnostic output from minimalmodbus ## \n\n'
-    text += 'Minimalmodbus version: ' + __version__ + '\n'
-    text += 'Minimalmodbus status: ' + __status__ + '\n'
-    text += 'Revision: ' + __revision__ + '\n'
-    text += 'Revision date: ' + __date__ + '\n'
-    text += 'File name (with relative path): ' + __file__ + '\n'
-    text += 'Full file path: ' + os.path.abspath(__file__) + '\n\n'
-    text += 'pySerial version: ' + serial.VERSION + '\n'
-    text += 'pySerial full file path: ' + os.path.abspath(serial.__file__) + '\n\n'
-    text += 'Platform: ' + sys.platform + '\n'
-    text += 'Filesystem encoding: ' + repr(sys.getfilesystemencoding()) + '\n'
-    text += 'Byteorder: ' + sys.byteorder + '\n'
-    text += 'Python version: ' + sys.version + '\n'
-    text += 'Python version info: ' + repr(sys.version_info) + '\n'
-    text += 'Python flags: ' + repr(sys.flags) + '\n'
-    text += 'Python argv: ' + repr(sys.argv) + '\n'
-    text += 'Python prefix: ' + repr(sys.prefix) + '\n'
-    text += 'Python exec prefix: ' + repr(sys.exec_prefix) + '\n'
-    text += 'Python executable: ' + repr(sys.executable) + '\n'
-    try:
-        text += 'Long info: ' + repr(sys.long_info) + '\n'
-    except:
-        text += 'Long info: (none)\n'  # For Python3 compatibility
-    try:
-        text += 'Float repr style: ' + repr(sys.float_repr_style) + '\n\n'
-    except:
-        text += 'Float repr style: (none) \n\n'  # For Python 2.6 compatibility
-    text += 'Variable __name__: ' + __name__ + '\n'
-    text += 'Current directory: ' + os.getcwd() + '\n\n'
-    text += 'Python path: \n'
-    text += '\n'.join(sys.path) + '\n'
-    text += '\n## End of diagnostic output ## \n'
-    return text
-
+    lines = ['']
+    lines.extend(_getStaticDiagnosticLines())
+    lines.append('Python argv: ' + repr(sys.argv))
+    lines.append('Current directory: ' + os.getcwd())
+    lines.append('')
+    lines.append('Python path: ')
+    lines.extend(sys.path)
+    lines.append('')
+    lines.append('## End of diagnostic output ## ')
+    lines.append('')
+    return '\n'.join(lines)
 
 if __name__ == "__main__":
     FB100 = Instrument("COM4", 1)
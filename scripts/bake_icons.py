@@ -0,0 +1,22 @@
+# Bakes the resized GUI images once, so the GUI does not have to resample them at every start.
+# Run it again after changing one of the source images: python scripts/bake_icons.py
+import os
+from PIL import Image
+
+RESAMPLE = Image.Resampling.LANCZOS
+GUI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GUI")
+
+#Source image, Size
+IMAGES = [
+    ("Images_logo/logo.png", (180, 50)),
+]
+
+def bakedPath(path, size):
+    root, ext = os.path.splitext(path)
+    return f"{root}.{size[0]}x{size[1]}{ext}"
+
+if __name__ == "__main__":
+    for path, size in IMAGES:
+        with Image.open(os.path.join(GUI_DIR, path)) as image:
+            image.resize(size, RESAMPLE).save(os.path.join(GUI_DIR, bakedPath(path, size)), optimize=True)
+        print(bakedPath(path, size))